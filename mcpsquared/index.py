@@ -0,0 +1,160 @@
+"""
+SQLite index over generated workflow packages
+
+The orchestrator registers each project directory right after a successful
+generation; the list/search tools then answer with one parameterized SELECT
+instead of walking WORK_DIR recursively per call.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from mcpsquared.utils import fastjson
+
+logger = logging.getLogger(__name__)
+
+_WORK_DIR = os.getenv("WORK_DIR") or "/tmp/mcpsquared"
+_DB_PATH = os.path.join(_WORK_DIR, ".mcpsquared_index.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workflows (
+    mcp_name TEXT NOT NULL,
+    domain TEXT,
+    name TEXT NOT NULL,
+    description TEXT,
+    path TEXT NOT NULL,
+    project_dir TEXT NOT NULL,
+    PRIMARY KEY (mcp_name, name)
+);
+CREATE INDEX IF NOT EXISTS idx_workflows_domain ON workflows(domain);
+"""
+
+# Shared connection - the query helpers run from worker threads, so the
+# connection is opened once and every use is serialized behind the lock
+_CONN = None
+_CONN_LOCK = threading.Lock()
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Open the index database on first use, creating the schema if needed"""
+    global _CONN
+    if _CONN is None:
+        os.makedirs(_WORK_DIR, exist_ok=True)
+        conn = sqlite3.connect(_DB_PATH, check_same_thread=False)
+        conn.executescript(_SCHEMA)
+        conn.row_factory = sqlite3.Row
+        _CONN = conn
+    return _CONN
+
+
+def index_project(mcp_name: str, project_dir: str) -> int:
+    """
+    Scan one generated project directory and upsert its workflows
+
+    Args:
+        mcp_name: Name of the source MCP
+        project_dir: Project directory containing a workflows/ subdirectory
+
+    Returns:
+        Number of workflows indexed
+    """
+    workflows_dir = Path(project_dir) / "workflows"
+    rows = []
+    try:
+        with os.scandir(workflows_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or entry.name == "_manifest.json":
+                    continue
+                try:
+                    workflow = fastjson.load_file(entry.path)
+                except (OSError, ValueError):
+                    logger.warning("Skipping unreadable workflow file: %s", entry.path)
+                    continue
+                rows.append((
+                    mcp_name,
+                    workflow.get("domain"),
+                    workflow.get("workflow_name") or entry.name[:-5],
+                    workflow.get("description"),
+                    entry.path,
+                    str(project_dir)
+                ))
+    except FileNotFoundError:
+        logger.warning("No workflows directory under project: %s", project_dir)
+        return 0
+
+    if rows:
+        with _CONN_LOCK:
+            conn = _get_conn()
+            conn.executemany(
+                "INSERT OR REPLACE INTO workflows "
+                "(mcp_name, domain, name, description, path, project_dir) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            conn.commit()
+
+    logger.info("Indexed %s workflows for MCP %s", len(rows), mcp_name)
+    return len(rows)
+
+
+def search_workflows(
+    mcp_name: Optional[str] = None,
+    domain: Optional[str] = None,
+    name_pattern: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Look up indexed workflows with optional filters
+
+    Args:
+        mcp_name: Filter by source MCP name
+        domain: Filter by workflow domain
+        name_pattern: Substring match on the workflow name
+
+    Returns:
+        List of workflow row dicts
+    """
+    clauses = []
+    params: List[Any] = []
+    if mcp_name:
+        clauses.append("mcp_name = ?")
+        params.append(mcp_name)
+    if domain:
+        clauses.append("domain = ?")
+        params.append(domain)
+    if name_pattern:
+        clauses.append("name LIKE ?")
+        params.append(f"%{name_pattern}%")
+
+    sql = "SELECT mcp_name, domain, name, description, path, project_dir FROM workflows"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY mcp_name, name"
+
+    with _CONN_LOCK:
+        rows = _get_conn().execute(sql, params).fetchall()
+    return [dict(row) for row in rows]
+
+
+def list_domains() -> List[Dict[str, Any]]:
+    """List distinct workflow domains with per-domain counts"""
+    with _CONN_LOCK:
+        rows = _get_conn().execute(
+            "SELECT domain, COUNT(*) AS workflow_count FROM workflows "
+            "WHERE domain IS NOT NULL GROUP BY domain ORDER BY domain"
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def list_mcps() -> List[Dict[str, Any]]:
+    """List processed MCPs with workflow and package counts"""
+    with _CONN_LOCK:
+        rows = _get_conn().execute(
+            "SELECT mcp_name, COUNT(*) AS workflow_count, "
+            "COUNT(DISTINCT project_dir) AS package_count "
+            "FROM workflows GROUP BY mcp_name ORDER BY mcp_name"
+        ).fetchall()
+    return [dict(row) for row in rows]
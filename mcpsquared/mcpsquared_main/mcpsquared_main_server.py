@@ -9,6 +9,7 @@ Provides the 5 core tools for MCPSquared workflow generation:
 5. package_workflow_mcp - Custom packaging
 """
 
+from contextlib import asynccontextmanager
 from fastmcp import FastMCP
 from typing import Dict, Any, List, Optional
 import asyncio
@@ -22,6 +23,7 @@ from pathlib import Path
 from mcpsquared_base.utils.debug import mcp_debug_log, setup_debug_interception
 
 from mcpsquared.simple_orchestrator import SimpleOrchestrator
+from mcpsquared.utils import fastjson
 
 # Setup logging - do not call basicConfig in library code
 logger = logging.getLogger(__name__)
@@ -30,16 +32,53 @@ logger = logging.getLogger(__name__)
 _DEBUG_LOG_PATH = None
 _DEBUG_NICKNAME = None
 
-def _debug_log(message: str):
+def _debug_log_real(message: str):
     """Helper to log debug message with configured path and nickname"""
     mcp_debug_log(message, _DEBUG_LOG_PATH, _DEBUG_NICKNAME)
 
+
+def _debug_log_noop(message: str):
+    """No-op stand-in so undebugged runs pay nothing per call"""
+
+
+# Rebound to _debug_log_real by main() only when debug env vars are set
+_debug_log = _debug_log_noop
+
+
+def _tool_response(obj, suffix: str = "") -> str:
+    """
+    Serialize a tool response dict in a single pass.
+
+    Wire responses stay compact (no indent) - pretty output is reserved for
+    file persistence. Orchestrator methods that already return JSON strings
+    are passed through untouched so nothing is encoded twice.
+    """
+    return fastjson.dumps(obj) + suffix
+
+@asynccontextmanager
+async def _lifespan(server):
+    """Close the orchestrator's shared client on the serving loop.
+
+    The merged-server stdio transport and httpx pool are bound to the loop
+    that created them, so aclose() must run there - awaiting them from a
+    fresh asyncio.run() loop after app.run() returns raises instead of
+    closing.
+    """
+    try:
+        yield
+    finally:
+        await orchestrator.aclose()
+
+
 # Create FastMCP app
-app = FastMCP("MCPSquared Workflow Generator")
+app = FastMCP("MCPSquared Workflow Generator", lifespan=_lifespan)
 
 # Create orchestrator instance
 orchestrator = SimpleOrchestrator()
 
+# Constant suffix appended to every successful generation response
+_HANDOFF_MESSAGE = "\n\nEverything is ready for you and the user to now add more. Help them out with your own filesystem tools and whatever testing they have available (if they have given you bash or other tools to do some kind of code execution). The generated code from MCPSquared is easy to understand and extend. You can help the user add anything else they want!"
+
 
 @app.tool()
 async def generate_flows_for_mcp(mcp_config: dict) -> str:
@@ -58,43 +97,44 @@ async def generate_flows_for_mcp(mcp_config: dict) -> str:
         result = await orchestrator.generate_workflows(mcp_config)
         logger.info("Workflow generation completed successfully")
         
-        # Convert result dict to JSON string and add handoff message
-        import json
-        result_json = json.dumps(result, indent=2)
-        handoff_message = "\n\nEverything is ready for you and the user to now add more. Help them out with your own filesystem tools and whatever testing they have available (if they have given you bash or other tools to do some kind of code execution). The generated code from MCPSquared is easy to understand and extend. You can help the user add anything else they want!"
-        
-        return result_json + handoff_message
+        # Serialize result once and add the precomputed handoff message
+        return _tool_response(result, suffix=_HANDOFF_MESSAGE)
     except Exception as e:
+        tb = traceback.format_exc()
         logger.error(f"Workflow generation failed: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        return f'{{"success": false, "error": "Workflow generation failed: {str(e)}", "traceback": "{traceback.format_exc()}"}}'
+        logger.error(f"Traceback: {tb}")
+        return _tool_response({
+            "success": False,
+            "error": f"Workflow generation failed: {str(e)}",
+            "traceback": tb
+        })
 
 
 @app.tool()
-def get_flows(domain: str = None) -> str:
+async def get_flows(domain: str = None) -> str:
     """
     List available generated workflows, optionally filtered by domain
-    
+
     Args:
         domain: Optional domain filter (e.g., "web", "files", "database")
-        
+
     Returns:
         JSON string with list of available workflows
     """
     logger.info(f"Listing workflows for domain: {domain or 'all'}")
-    return orchestrator.get_flows(domain)
+    return await asyncio.to_thread(orchestrator.get_flows, domain)
 
 
-@app.tool() 
-def get_flow_domains() -> str:
+@app.tool()
+async def get_flow_domains() -> str:
     """
     List all available workflow domains/categories
-    
+
     Returns:
         JSON string with available domains and their descriptions
     """
     logger.info("Listing workflow domains")
-    return orchestrator.get_flow_domains()
+    return await asyncio.to_thread(orchestrator.get_flow_domains)
 
 
 @app.tool()
@@ -130,19 +170,19 @@ def package_workflow_mcp(workflows: list, base_mcp: str) -> str:
 
 
 @app.tool()
-def get_processed_mcps_list() -> str:
+async def get_processed_mcps_list() -> str:
     """
     Get list of all MCPs that have been processed by MCPSquared
-    
+
     Returns:
         JSON string with list of MCP names and basic stats about packages and workflows
     """
     logger.info("Getting processed MCPs list via orchestrator")
-    return orchestrator.get_processed_mcps_list()
+    return await asyncio.to_thread(orchestrator.get_processed_mcps_list)
 
 
 @app.tool()
-def search_my_workflows(
+async def search_my_workflows(
     mcp_name: Optional[str] = None,
     domain: Optional[str] = None,
     workflow_name_pattern: Optional[str] = None
@@ -159,11 +199,11 @@ def search_my_workflows(
         JSON string with search results and metadata
     """
     logger.info(f"Searching workflows via orchestrator: mcp={mcp_name}, domain={domain}, pattern={workflow_name_pattern}")
-    return orchestrator.search_my_workflows(mcp_name, domain, workflow_name_pattern)
+    return await asyncio.to_thread(orchestrator.search_my_workflows, mcp_name, domain, workflow_name_pattern)
 
 
 @app.tool()
-def execute_any_workflow(
+async def execute_any_workflow(
     workflow_name: str,
     workflow_args: Dict[str, Any],
     package_name: Optional[str] = None
@@ -180,15 +220,25 @@ def execute_any_workflow(
         JSON string with execution results
     """
     logger.info(f"Executing workflow via orchestrator: {workflow_name} from package: {package_name or 'any'}")
-    return orchestrator.execute_any_workflow(workflow_name, workflow_args, package_name)
+    return await orchestrator.execute_any_workflow(workflow_name, workflow_args, package_name)
+
+
+# Env-key filter and per-process constants for the debug tool - the static
+# portion never changes after startup, so compute it once at import
+_ENV_KEY_WORDS = ('MCP', 'SCHEMA', 'WORK', 'API', 'PATH', 'PHASE')
+_STATIC_DEBUG_INFO = {
+    "python_executable": sys.executable,
+    "python_version": sys.version,
+    "process_id": os.getpid(),
+    "parent_process_id": os.getppid()
+}
 
 
 @app.tool()
-async def debug_environment_mcpsquared_main() -> dict:
+async def debug_environment_mcpsquared_main() -> str:
     """Debug tool to check environment variables in MCPSquared main MCP server"""
-    import os
-    import sys
-    return {
+    path_value = os.getenv('PATH', 'NOT SET')
+    response = {
         "status": "success",
         "environment": {
             "OPENAI_API_KEY": "SET" if os.getenv('OPENAI_API_KEY') else "NOT SET",
@@ -197,32 +247,41 @@ async def debug_environment_mcpsquared_main() -> dict:
             "MCPSQUARED_CONFIG_DIR": os.getenv('MCPSQUARED_CONFIG_DIR', 'NOT SET'),
             "PHASE_TOOLS_MCP_SERVER_PATH": os.getenv('PHASE_TOOLS_MCP_SERVER_PATH', 'NOT SET'),
             "PYTHONPATH": os.getenv('PYTHONPATH', 'NOT SET'),
-            "PATH": os.getenv('PATH', 'NOT SET')[:200] + "..." if len(os.getenv('PATH', '')) > 200 else os.getenv('PATH', 'NOT SET'),
+            "PATH": path_value[:200] + "..." if len(path_value) > 200 else path_value,
             "current_working_directory": os.getcwd(),
-            "python_executable": sys.executable,
             "python_path": sys.path[:5],  # First 5 entries
-            "python_version": sys.version,
-            "process_id": os.getpid(),
-            "parent_process_id": os.getppid(),
-            "all_env_keys": sorted([k for k in os.environ.keys() if any(word in k.upper() for word in ['MCP', 'SCHEMA', 'WORK', 'API', 'PATH', 'PHASE'])])
+            **_STATIC_DEBUG_INFO,
+            "all_env_keys": sorted(k for k in os.environ if any(word in k.upper() for word in _ENV_KEY_WORDS))
         }
     }
+    # Pre-serialized so FastMCP frames the string as-is instead of walking the dict
+    return _tool_response(response)
 
 
 def main():
     """Main entry point for console script"""
     # Read debug environment variables for this MCP
-    global _DEBUG_LOG_PATH, _DEBUG_NICKNAME
+    global _DEBUG_LOG_PATH, _DEBUG_NICKNAME, _debug_log
     _DEBUG_LOG_PATH = os.getenv("MAIN_DEBUG_PATH")
     _DEBUG_NICKNAME = os.getenv("MAIN_DEBUG_NICKNAME")
-    
-    # Set up debug interception if configured
+
+    # Set up debug interception if configured; otherwise _debug_log stays a no-op
     if _DEBUG_LOG_PATH and _DEBUG_NICKNAME:
+        _debug_log = _debug_log_real
         setup_debug_interception(_DEBUG_LOG_PATH, _DEBUG_NICKNAME)
         _debug_log("main: Debug interception set up for main server")
     
     logger.info("Starting MCPSquared FastMCP Server")
     _debug_log("main: Starting MCPSquared FastMCP Server - mcpsquared_main_server")
+
+    # Prefer uvloop when available - the server is pure IO (stdio framing
+    # plus the orchestrator's HTTPS calls) and the libuv loop polls cheaper
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     app.run()
 
 
@@ -5,25 +5,41 @@ Single MCP with all phase + schema tools merged
 
 import os
 import sys
-import json
+import asyncio
+import functools
+import hashlib
 import logging
+import time
 import traceback
+from contextlib import asynccontextmanager
+from itertools import chain, islice
 from typing import List, Dict, Any, Optional
-from datetime import datetime
 from pathlib import Path
 from fastmcp import FastMCP
 from pydantic import BaseModel
 from mcp_use import MCPClient
 
-# TEMPORARY: sys.path hack until mcpsquared-base is properly installed
-# TODO: Remove this hack and use normal imports: from mcpsquared_base.models.schemas import ...
-# Requires: pip install /tmp/mcpsquared-base
-sys.path.insert(0, '/tmp/mcpsquared-base')
-from mcpsquared_base.models.schemas import (
-    TemplatedArg, WorkflowConfig, AgentConfig, MCPServerConfig, MCPClientConfig, InputArgs, InputArg
-)
-from mcpsquared_base.utils.workflow_runner import run_workflow
-from mcpsquared_base.utils.debug import agent_debug_log, mcp_debug_log
+# mcpsquared-base is a normal installed dependency; MCPSQUARED_BASE_PATH is a
+# dev-mode escape hatch for running against an uninstalled checkout
+try:
+    from mcpsquared_base.models.schemas import (
+        TemplatedArg, WorkflowConfig, AgentConfig, MCPServerConfig, MCPClientConfig, InputArgs, InputArg
+    )
+    from mcpsquared_base.utils.workflow_runner import run_workflow
+    from mcpsquared_base.utils.debug import agent_debug_log, mcp_debug_log
+except ImportError:
+    _base_path = os.getenv("MCPSQUARED_BASE_PATH")
+    if not _base_path:
+        raise
+    sys.path.insert(0, _base_path)
+    from mcpsquared_base.models.schemas import (
+        TemplatedArg, WorkflowConfig, AgentConfig, MCPServerConfig, MCPClientConfig, InputArgs, InputArg
+    )
+    from mcpsquared_base.utils.workflow_runner import run_workflow
+    from mcpsquared_base.utils.debug import agent_debug_log, mcp_debug_log
+
+from mcpsquared.utils import fastjson
+from mcpsquared.utils.caching import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -33,68 +49,143 @@ logger = logging.getLogger(__name__)
 
 # ============= PHASE 1 TOOLS (MCP Analysis) =============
 
-async def phase1_1_install_mcp_tool(name: str, command: str, args: List[str]) -> dict:
-    """
-    Phase 1.1: Test connection to user's MCP
+# Shared sessions keyed by MCP signature so phases 1.1 and 1.2 reuse one
+# subprocess + stdio handshake instead of spawning the user's MCP twice.
+# The lock serializes the miss path - FastMCP dispatches tool calls
+# concurrently, and two simultaneous misses would spawn two subprocesses
+# with one of the clients left unreachable
+_shared_sessions: Dict[tuple, tuple] = {}
+_shared_sessions_lock = asyncio.Lock()
+
+# Tool listings for a given MCP signature are static within a generation run,
+# so repeat discovery can skip the session and file writes entirely
+_discovery_cache = TTLCache(maxsize=128, ttl=300.0)
+
+# Derived tool groupings keyed by the tools file's content digest
+_tool_groups_cache = TTLCache(maxsize=128, ttl=300.0)
+
+# Directories already ensured this process - skips a mkdir syscall per call
+_ensured_dirs: set = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """mkdir -p, skipping the syscall for directories already ensured"""
+    key = str(path)
+    if key not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(key)
+
+
+async def _get_or_open_session(name: str, command: str, args: List[str]):
+    """Get the cached session for this MCP signature, opening one if needed"""
+    key = (name, command, tuple(args))
+    if key in _shared_sessions:
+        mcp_debug_log(f"Reusing cached session for {name}")
+        return _shared_sessions[key][1]
+
+    async with _shared_sessions_lock:
+        # Double-check: another call may have opened it while we waited
+        if key in _shared_sessions:
+            mcp_debug_log(f"Reusing cached session for {name}")
+            return _shared_sessions[key][1]
+
+        mcp_config = MCPServerConfig(name=name, command=command, args=args)
+        mcp_debug_log(f"Created MCPServerConfig: {mcp_config.model_dump()}")
+
+        client_config = {"mcpServers": {name: mcp_config.model_dump()}}
+        client = MCPClient.from_dict(client_config)
+
+        mcp_debug_log(f"Creating session for {name}")
+        try:
+            session = await client.create_session(name)
+        except BaseException:
+            # Don't leak the half-spawned subprocess when the handshake fails
+            try:
+                await client.close_all_sessions()
+            except Exception as close_err:
+                logger.debug(f"Cleanup of failed session for {name} failed: {close_err}")
+            raise
+        _shared_sessions[key] = (client, session)
+        return session
+
+
+async def _evict_session(key: tuple) -> None:
+    """Drop a pooled session whose MCP stopped responding.
+
+    Without eviction a dead subprocess poisons every retry for the same
+    signature until the whole server restarts; dropping the entry makes the
+    next call respawn it.
     """
-    logger.info(f"Phase 1.1: Testing connection to {name}")
-    mcp_debug_log(f"phase1_1_install_mcp_tool: Testing connection to {name}")
-    
-    mcp_config = MCPServerConfig(name=name, command=command, args=args)
-    mcp_debug_log(f"Created MCPServerConfig: {mcp_config.model_dump()}")
-    
-    # Test connection
-    client_config = {"mcpServers": {name: mcp_config.model_dump()}}
-    client = MCPClient.from_dict(client_config)
-    
+    entry = _shared_sessions.pop(key, None)
+    if entry is None:
+        return
+    client, _ = entry
     try:
-        mcp_debug_log(f"Creating session for {name}")
-        session = await client.create_session(name)
-        mcp_debug_log(f"Session created successfully, listing tools")
-        tools = await session.list_tools()
-        logger.info(f"Successfully connected to {name}, found {len(tools)} tools")
-        mcp_debug_log(f"Found {len(tools)} tools: {[tool.name for tool in tools]}")
-        
-        # Save config for later use
-        work_dir = os.getenv("WORK_DIR", "/tmp/mcpsquared")
-        mcp_configs_dir = Path(work_dir) / "mcp_configs"
-        mcp_configs_dir.mkdir(parents=True, exist_ok=True)
-        
-        config_file = mcp_configs_dir / f"{name}_config.json"
-        with open(config_file, 'w') as f:
-            json.dump(mcp_config.model_dump(), f, indent=2)
-        
-        return {
-            "status": "success",
-            "phase": "1.1",
-            "mcp_name": name,
-            "connection_tested": True,
-            "tools_found": len(tools)
-        }
+        await client.close_all_sessions()
     except Exception as e:
-        logger.error(f"Connection failed: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        return {"status": "error", "error": str(e), "traceback": traceback.format_exc()}
-    finally:
+        logger.debug(f"Closing evicted session failed: {e}")
+
+
+async def _close_shared_sessions() -> None:
+    """Close all cached MCP sessions (end-of-run cleanup)"""
+    for client, _ in _shared_sessions.values():
         await client.close_all_sessions()
+    _shared_sessions.clear()
 
-async def phase1_2_list_mcp_tools_tool(name: str, command: str, args: List[str]) -> dict:
+
+def _save_mcp_config_file(name: str, command: str, args: List[str]) -> None:
+    """Save MCP config for later phases to use"""
+    mcp_config = MCPServerConfig(name=name, command=command, args=args)
+    work_dir = os.getenv("WORK_DIR", "/tmp/mcpsquared")
+    mcp_configs_dir = Path(work_dir) / "mcp_configs"
+    _ensure_dir(mcp_configs_dir)
+
+    config_file = mcp_configs_dir / f"{name}_config.json"
+    fastjson.dump_model_file(mcp_config, config_file)
+
+
+def _save_tools_file(name: str, tools: List[str], schemas: List[dict]) -> Path:
+    """Save discovered tools data to a timestamped project directory"""
+    work_dir = os.getenv("WORK_DIR", "/tmp/mcpsquared")
+    # time.strftime formats in C without datetime's locale machinery
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    project_dir = Path(work_dir) / f"{name}_project_{timestamp}"
+    project_dir.mkdir(parents=True, exist_ok=True)
+
+    tools_file = project_dir / f"mcp_tools_{name}.json"
+    tools_data = {
+        "mcp_name": name,
+        "tools": tools,
+        "schemas": schemas
+    }
+
+    # Schemas can run to megabytes for large MCPs - stream them to disk
+    fastjson.dump_file_streaming(tools_data, tools_file, stream_key="schemas")
+    return tools_file
+
+
+async def phase1_discover(name: str, command: str, args: List[str]) -> dict:
     """
-    Phase 1.2: Discover all tools from MCP
+    Fused Phase 1: test connection and discover tools within a single session
     """
-    logger.info(f"Phase 1.2: Discovering tools from {name}")
-    
-    mcp_config = MCPServerConfig(name=name, command=command, args=args)
-    client_config = {"mcpServers": {name: mcp_config.model_dump()}}
-    client = MCPClient.from_dict(client_config)
-    
+    logger.info(f"Phase 1: Connecting to {name} and discovering tools")
+    mcp_debug_log(f"phase1_discover: single-session connect + discover for {name}")
+
+    cache_key = (name, command, tuple(args))
+    cached = _discovery_cache.get(cache_key)
+    if cached is not None:
+        mcp_debug_log(f"phase1_discover: cache hit for {name}")
+        return _build_phase1_success_response(name, *cached)
+
     try:
-        session = await client.create_session(name)
+        session = await _get_or_open_session(name, command, args)
         available_tools = await session.list_tools()
-        
+        logger.info(f"Successfully connected to {name}, found {len(available_tools)} tools")
+        mcp_debug_log(f"Found {len(available_tools)} tools: {[tool.name for tool in available_tools]}")
+
         tools = []
         schemas = []
-        
+
         for tool in available_tools:
             # Use MCP prefixed naming
             prefixed_name = f"mcp__{name}__{tool.name}"
@@ -104,44 +195,177 @@ async def phase1_2_list_mcp_tools_tool(name: str, command: str, args: List[str])
                 "description": getattr(tool, 'description', ''),
                 "parameters": getattr(tool, 'inputSchema', {})
             })
-        
-        # Save tools data
-        work_dir = os.getenv("WORK_DIR", "/tmp/mcpsquared")
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        project_dir = Path(work_dir) / f"{name}_project_{timestamp}"
-        project_dir.mkdir(parents=True, exist_ok=True)
-        
-        tools_file = project_dir / f"mcp_tools_{name}.json"
-        tools_data = {
-            "mcp_name": name,
-            "tools": tools,
-            "schemas": schemas
-        }
-        
-        with open(tools_file, 'w') as f:
-            json.dump(tools_data, f, indent=2)
-        
-        logger.info(f"Discovered {len(tools)} tools from {name}")
-        
-        return {
-            "status": "success",
-            "phase": "1.2",
-            "mcp_name": name,
-            "tools_count": len(tools),
-            "tools": tools[:5],  # First 5 for display
-            "tools_file_path": str(tools_file)
-        }
-        
+
+        _save_mcp_config_file(name, command, args)
+        tools_file = _save_tools_file(name, tools, schemas)
+
+        _discovery_cache.set(cache_key, (tools, str(tools_file)))
+        return _build_phase1_success_response(name, tools, str(tools_file))
+
     except Exception as e:
-        logger.error(f"Tool discovery failed: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        return {"status": "error", "error": str(e), "traceback": traceback.format_exc()}
-    finally:
-        await client.close_all_sessions()
+        tb = traceback.format_exc()
+        logger.error(f"Phase 1 discovery failed: {e}")
+        logger.error(f"Traceback: {tb}")
+        # The pooled session may be the failure - evict it so a retry gets
+        # a fresh subprocess instead of the same dead transport
+        await _evict_session(cache_key)
+        return {"status": "error", "error": str(e), "traceback": tb}
+
+
+def _build_phase1_success_response(name: str, tools: List[str], tools_file_path: str) -> dict:
+    """Build success response for fused phase 1"""
+    return {
+        "status": "success",
+        "phase": "1",
+        "mcp_name": name,
+        "connection_tested": True,
+        "tools_count": len(tools),
+        "tools": tools[:5],  # First 5 for display
+        "tools_file_path": tools_file_path
+    }
+
+
+async def phase1_1_install_mcp_tool(name: str, command: str, args: List[str]) -> dict:
+    """
+    Phase 1.1: Test connection to user's MCP
+    """
+    logger.info(f"Phase 1.1: Testing connection to {name}")
+
+    result = await phase1_discover(name, command, args)
+    if result["status"] != "success":
+        return result
+
+    return {
+        "status": "success",
+        "phase": "1.1",
+        "mcp_name": name,
+        "connection_tested": True,
+        "tools_found": result["tools_count"]
+    }
+
+async def phase1_2_list_mcp_tools_tool(name: str, command: str, args: List[str]) -> dict:
+    """
+    Phase 1.2: Discover all tools from MCP
+    """
+    logger.info(f"Phase 1.2: Discovering tools from {name}")
+
+    result = await phase1_discover(name, command, args)
+    if result["status"] != "success":
+        return result
+
+    return {**result, "phase": "1.2"}
 
 # ============= PHASE 2 TOOLS (Workflow Generation) =============
 
-def phase2_1_create_workflow_configs(
+# Keyword -> operation group dispatch, hoisted to module level so the
+# classification loop does one .lower() per tool and a single keyword scan
+# instead of re-allocating keyword lists five times per tool
+_KEYWORD_TO_GROUP = {
+    'create': 'create', 'add': 'create', 'new': 'create',
+    'read': 'read', 'get': 'read', 'list': 'read', 'fetch': 'read',
+    'update': 'update', 'edit': 'update', 'modify': 'update',
+    'delete': 'delete', 'remove': 'delete',
+    'query': 'query', 'search': 'query', 'find': 'query'
+}
+
+
+# The templated args and workflow shells are identical on every call - build
+# the pydantic models once at import and hand out model_copy updates instead
+# of paying full field validation per call
+_CRUD_TEMPLATED_ARGS = (
+    TemplatedArg(name="operation", description="CRUD operation to perform"),
+    TemplatedArg(name="entity", description="Entity to operate on"),
+    TemplatedArg(name="data", description="Data for the operation")
+)
+_QUERY_TEMPLATED_ARGS = (
+    TemplatedArg(name="query", description="Search query"),
+    TemplatedArg(name="filters", description="Optional filters", required=False)
+)
+_GENERAL_TEMPLATED_ARGS = (
+    TemplatedArg(name="task_description", description="Description of task to perform"),
+)
+
+_CRUD_WORKFLOW_PROTO = WorkflowConfig(
+    workflow_name="",
+    description="",
+    agent_config_name="",
+    input_prompt="Perform {{operation}} on {{entity}} with data: {{data}}",
+    templated_args=list(_CRUD_TEMPLATED_ARGS),
+    tool_sequence=[],
+    domain="data_management"
+)
+_QUERY_WORKFLOW_PROTO = WorkflowConfig(
+    workflow_name="",
+    description="",
+    agent_config_name="",
+    input_prompt="Search for {{query}} with filters: {{filters}}",
+    templated_args=list(_QUERY_TEMPLATED_ARGS),
+    tool_sequence=[],
+    domain="information_retrieval"
+)
+_GENERAL_WORKFLOW_PROTO = WorkflowConfig(
+    workflow_name="",
+    description="",
+    agent_config_name="",
+    input_prompt="{{task_description}}",
+    templated_args=list(_GENERAL_TEMPLATED_ARGS),
+    tool_sequence=[],
+    domain="general"
+)
+
+
+def _classify_tool(tool_name: str) -> str:
+    """Classify a tool name into an operation group (dict order = priority)"""
+    lowered = tool_name.lower()
+    for keyword, group in _KEYWORD_TO_GROUP.items():
+        if keyword in lowered:
+            return group
+    return 'other'
+
+
+# How many tools per group phase 2.1 actually consumes - appending past these
+# caps would only build lists that get sliced away
+_GROUP_CAPS = {'create': 2, 'read': 2, 'update': 0, 'delete': 0, 'query': 3, 'other': 0}
+
+
+def _group_tools_by_operation(tools: List[str], caps: Optional[Dict[str, int]] = None) -> Dict[str, List[str]]:
+    """
+    Group tools by operation type based on name keywords.
+
+    With caps, each group keeps only its first caps[group] tools, so wide
+    MCPs don't accumulate entries no caller will ever read.
+    """
+    tool_groups = {
+        'create': [],
+        'read': [],
+        'update': [],
+        'delete': [],
+        'query': [],
+        'other': []
+    }
+
+    for tool in tools:
+        tool_name = tool.split('__')[-1] if '__' in tool else tool
+        group = _classify_tool(tool_name)
+        bucket = tool_groups[group]
+        if caps is None or len(bucket) < caps.get(group, 0):
+            bucket.append(tool)
+
+    return tool_groups
+
+
+def _write_file_bytes(path: Path, payload: bytes) -> None:
+    """Write one pre-serialized payload - the unit of work for thread offload"""
+    with open(path, 'wb') as f:
+        f.write(payload)
+
+
+async def _write_files_concurrently(items: List[tuple]) -> None:
+    """Write pre-serialized (path, bytes) pairs concurrently off the event loop"""
+    await asyncio.gather(*(asyncio.to_thread(_write_file_bytes, path, payload) for path, payload in items))
+
+
+async def phase2_1_create_workflow_configs(
     tools_file_path: str,
     user_requirements: str = "Create comprehensive workflows for all tools"
 ) -> dict:
@@ -152,98 +376,70 @@ def phase2_1_create_workflow_configs(
     logger.info(f"Phase 2.1: Creating workflow configs from {tools_file_path}")
     
     try:
-        # Load tools data
-        with open(tools_file_path, 'r') as f:
-            tools_data = json.load(f)
-        
+        # Load tools data, keeping the raw bytes for the cache digest
+        with open(tools_file_path, 'rb') as f:
+            raw_tools_data = f.read()
+        tools_data = fastjson.loads(raw_tools_data)
+
         mcp_name = tools_data['mcp_name']
         tools = tools_data['tools']
-        
+
         # Generate workflows based on tool patterns
         workflows = []
-        
-        # Group tools by operation type
-        tool_groups = {
-            'create': [],
-            'read': [],
-            'update': [],
-            'delete': [],
-            'query': [],
-            'other': []
-        }
-        
-        for tool in tools:
-            tool_name = tool.split('__')[-1] if '__' in tool else tool
-            
-            if any(op in tool_name.lower() for op in ['create', 'add', 'new']):
-                tool_groups['create'].append(tool)
-            elif any(op in tool_name.lower() for op in ['read', 'get', 'list', 'fetch']):
-                tool_groups['read'].append(tool)
-            elif any(op in tool_name.lower() for op in ['update', 'edit', 'modify']):
-                tool_groups['update'].append(tool)
-            elif any(op in tool_name.lower() for op in ['delete', 'remove']):
-                tool_groups['delete'].append(tool)
-            elif any(op in tool_name.lower() for op in ['query', 'search', 'find']):
-                tool_groups['query'].append(tool)
-            else:
-                tool_groups['other'].append(tool)
-        
+
+        # Group tools by operation type - cached by content digest so
+        # regenerating workflows for the same MCP skips reclassification
+        digest = hashlib.blake2b(raw_tools_data).hexdigest()
+        tool_groups = _tool_groups_cache.get(digest)
+        if tool_groups is None:
+            tool_groups = _group_tools_by_operation(tools, caps=_GROUP_CAPS)
+            _tool_groups_cache.set(digest, tool_groups)
+
         # Create CRUD workflow if applicable
         if tool_groups['create'] and tool_groups['read']:
-            workflow = WorkflowConfig(
-                workflow_name=f"{mcp_name}_crud_workflow",
-                description=f"Create, read, update, and delete operations for {mcp_name}",
-                agent_config_name=f"{mcp_name}_crud_agent",
-                input_prompt="Perform {{operation}} on {{entity}} with data: {{data}}",
-                templated_args=[
-                    TemplatedArg(name="operation", description="CRUD operation to perform"),
-                    TemplatedArg(name="entity", description="Entity to operate on"),
-                    TemplatedArg(name="data", description="Data for the operation")
-                ],
-                tool_sequence=tool_groups['create'][:2] + tool_groups['read'][:2],
-                domain="data_management"
-            )
+            workflow = _CRUD_WORKFLOW_PROTO.model_copy(update={
+                'workflow_name': f"{mcp_name}_crud_workflow",
+                'description': f"Create, read, update, and delete operations for {mcp_name}",
+                'agent_config_name': f"{mcp_name}_crud_agent",
+                'tool_sequence': list(chain(islice(tool_groups['create'], 2), islice(tool_groups['read'], 2)))
+            })
             workflows.append(workflow)
-        
+
         # Create query workflow if applicable
         if tool_groups['query']:
-            workflow = WorkflowConfig(
-                workflow_name=f"{mcp_name}_query_workflow",
-                description=f"Query and search operations for {mcp_name}",
-                agent_config_name=f"{mcp_name}_query_agent",
-                input_prompt="Search for {{query}} with filters: {{filters}}",
-                templated_args=[
-                    TemplatedArg(name="query", description="Search query"),
-                    TemplatedArg(name="filters", description="Optional filters", required=False)
-                ],
-                tool_sequence=tool_groups['query'][:3],
-                domain="information_retrieval"
-            )
+            workflow = _QUERY_WORKFLOW_PROTO.model_copy(update={
+                'workflow_name': f"{mcp_name}_query_workflow",
+                'description': f"Query and search operations for {mcp_name}",
+                'agent_config_name': f"{mcp_name}_query_agent",
+                'tool_sequence': list(islice(tool_groups['query'], 3))
+            })
             workflows.append(workflow)
-        
+
         # Create general workflow with all tools
-        workflow = WorkflowConfig(
-            workflow_name=f"{mcp_name}_general_workflow",
-            description=f"General purpose workflow using all {mcp_name} tools",
-            agent_config_name=f"{mcp_name}_general_agent",
-            input_prompt="{{task_description}}",
-            templated_args=[
-                TemplatedArg(name="task_description", description="Description of task to perform")
-            ],
-            tool_sequence=tools[:10],  # Limit to first 10 tools
-            domain="general"
-        )
+        workflow = _GENERAL_WORKFLOW_PROTO.model_copy(update={
+            'workflow_name': f"{mcp_name}_general_workflow",
+            'description': f"General purpose workflow using all {mcp_name} tools",
+            'agent_config_name': f"{mcp_name}_general_agent",
+            'tool_sequence': list(islice(tools, 10))  # Limit to first 10 tools
+        })
         workflows.append(workflow)
         
         # Save workflow configs as individual files
         project_dir = Path(tools_file_path).parent
         workflows_dir = project_dir / "workflows"
-        workflows_dir.mkdir(exist_ok=True)
+        _ensure_dir(workflows_dir)
         
-        for workflow in workflows:
-            workflow_file = workflows_dir / f"{workflow.workflow_name}.json"
-            with open(workflow_file, 'w') as f:
-                json.dump(workflow.model_dump(), f, indent=2)
+        # Serialize once per workflow, then submit all writes concurrently.
+        # The manifest concatenates every workflow so later loads are one read.
+        workflow_files = [
+            (workflows_dir / f"{workflow.workflow_name}.json", workflow.model_dump_json(indent=2).encode())
+            for workflow in workflows
+        ]
+        workflow_files.append((
+            workflows_dir / "_manifest.json",
+            fastjson.dump_bytes([workflow.model_dump() for workflow in workflows])
+        ))
+        await _write_files_concurrently(workflow_files)
         
         logger.info(f"Created {len(workflows)} workflow configs")
         
@@ -255,13 +451,15 @@ def phase2_1_create_workflow_configs(
         }
         
     except Exception as e:
+        tb = traceback.format_exc()
         logger.error(f"Workflow creation failed: {e}")
-        return {"status": "error", "error": str(e), "traceback": traceback.format_exc()}
+        return {"status": "error", "error": str(e), "traceback": tb}
 
-def _analyze_tool_capabilities(tools: List[str]) -> List[str]:
-    """Analyze tools to understand MCP capabilities"""
+@functools.lru_cache(maxsize=256)
+def _analyze_tool_capabilities(tools: tuple) -> tuple:
+    """Analyze tools to understand MCP capabilities (memoized per tool set)"""
     tool_descriptions = []
-    
+
     for tool in tools[:5]:  # First 5 tools
         if 'add' in tool or 'create' in tool:
             tool_descriptions.append("create new entities")
@@ -271,11 +469,12 @@ def _analyze_tool_capabilities(tools: List[str]) -> List[str]:
             tool_descriptions.append("list existing entities")
         elif 'update' in tool or 'edit' in tool:
             tool_descriptions.append("modify existing entities")
-    
-    return tool_descriptions
 
-def _generate_system_prompt(mcp_name: str, tool_descriptions: List[str]) -> str:
-    """Generate intelligent system prompt based on capabilities"""
+    return tuple(tool_descriptions)
+
+@functools.lru_cache(maxsize=256)
+def _generate_system_prompt(mcp_name: str, tool_descriptions: tuple) -> str:
+    """Generate intelligent system prompt based on capabilities (memoized)"""
     capabilities = ", ".join(set(tool_descriptions)) if tool_descriptions else "perform various operations"
     return f"You are an expert agent for the {mcp_name} system. You can {capabilities} using the available tools. Execute tasks efficiently and provide clear results."
 
@@ -283,8 +482,8 @@ def _create_agent_from_workflow(workflow: dict, mcp_name: str) -> AgentConfig:
     """Helper to create agent config from workflow"""
     agent_name = workflow['agent_config_name']
     tools = workflow['tool_sequence']
-    
-    tool_descriptions = _analyze_tool_capabilities(tools)
+
+    tool_descriptions = _analyze_tool_capabilities(tuple(tools))
     system_prompt = _generate_system_prompt(mcp_name, tool_descriptions)
     
     return AgentConfig(
@@ -297,23 +496,30 @@ def _create_agent_from_workflow(workflow: dict, mcp_name: str) -> AgentConfig:
         max_steps=20
     )
 
-def _save_agent_configs(agents: dict, configs_dir: Path) -> None:
-    """Helper to save agent configs to files"""
-    configs_dir.mkdir(exist_ok=True)
-    
-    for agent_name, agent in agents.items():
-        config_file = configs_dir / f"{agent_name}.json"
-        with open(config_file, 'w') as f:
-            json.dump(agent.model_dump(), f, indent=2)
+async def _save_agent_configs(agents: dict, configs_dir: Path) -> None:
+    """Helper to save agent configs to files concurrently"""
+    _ensure_dir(configs_dir)
+
+    await _write_files_concurrently([
+        (configs_dir / f"{agent_name}.json", agent.model_dump_json(indent=2).encode())
+        for agent_name, agent in agents.items()
+    ])
 
 def _load_workflow_configs(workflows_directory: str) -> tuple[list, str]:
-    """Load all workflow configs from directory"""
-    workflows = []
+    """Load all workflow configs from directory (single manifest read when present)"""
     workflows_dir = Path(workflows_directory)
-    for workflow_file in workflows_dir.glob("*.json"):
-        with open(workflow_file, 'r') as f:
-            workflows.append(json.load(f))
-    
+
+    manifest_file = workflows_dir / "_manifest.json"
+    if manifest_file.exists():
+        workflows = fastjson.load_file(manifest_file)
+    else:
+        # Backward compat: per-file scan for directories written before
+        # manifests. os.scandir + binary reads skip the per-entry Path
+        # allocation and the text-mode decode pass that glob + open('r') paid.
+        with os.scandir(workflows_directory) as entries:
+            workflow_paths = [entry.path for entry in entries if entry.is_file() and entry.name.endswith('.json')]
+        workflows = [fastjson.load_file(path) for path in sorted(workflow_paths)]
+
     # Extract MCP name from first workflow
     mcp_name = workflows[0]['workflow_name'].rsplit('_', 2)[0] if workflows else "unknown"
     return workflows, mcp_name
@@ -343,25 +549,36 @@ def _build_phase2_2_success_response(agents: dict, configs_dir_str: str) -> dict
         "project_complete": True
     }
 
-def phase2_2_create_agent_configs(workflows_directory: str) -> dict:
+async def phase2_2_create_agent_configs(workflows_directory: str) -> dict:
     """Phase 2.2: Generate agent configurations from workflows"""
     logger.info(f"Phase 2.2: Creating agent configs from {workflows_directory}")
-    
+
     try:
         agents, configs_dir_str = _create_agent_configs_from_workflows(workflows_directory)
-        _save_agent_configs(agents, Path(configs_dir_str))
+        await _save_agent_configs(agents, Path(configs_dir_str))
         
         logger.info(f"Created {len(agents)} agent configs")
         return _build_phase2_2_success_response(agents, configs_dir_str)
         
     except Exception as e:
+        tb = traceback.format_exc()
         logger.error(f"Agent config creation failed: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        return {"status": "error", "error": str(e), "traceback": traceback.format_exc()}
+        logger.error(f"Traceback: {tb}")
+        return {"status": "error", "error": str(e), "traceback": tb}
 
 # ============= FASTMCP SERVER SETUP =============
 
-app = FastMCP("MCPSquared Minimal")
+@asynccontextmanager
+async def _lifespan(server):
+    """Close shared sessions on the serving loop - their transports are
+    bound to it, so a fresh asyncio.run() loop cannot close them"""
+    try:
+        yield
+    finally:
+        await _close_shared_sessions()
+
+
+app = FastMCP("MCPSquared Minimal", lifespan=_lifespan)
 
 # Register generation tools
 app.tool()(phase1_1_install_mcp_tool)
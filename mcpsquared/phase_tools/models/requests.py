@@ -1,14 +1,24 @@
 """Request models for phase tools"""
 
-from pydantic import BaseModel
+from functools import cached_property
+
+from pydantic import BaseModel, ConfigDict
 from typing import List
 
 
 class MCPConfig(BaseModel):
+    # Frozen so the cached dump below can never go stale
+    model_config = ConfigDict(frozen=True)
+
     name: str
     command: str
     args: List[str]
 
+    @cached_property
+    def as_dict(self) -> dict:
+        """model_dump computed once per instance - Phase 1.1 and 1.2 reuse it"""
+        return self.model_dump()
+
 
 class ToolsFileRequest(BaseModel):
     tools_file_path: str
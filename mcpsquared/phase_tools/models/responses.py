@@ -0,0 +1,59 @@
+"""Typed response shapes for phase tool handlers
+
+TypedDicts keep every response of the same kind using an identical key
+layout, so CPython shares key tables across allocations and orjson can
+serialize them on its fast path. At runtime they are plain dicts.
+"""
+
+from typing import Any, Dict, List, Literal, TypedDict
+
+from pydantic import BaseModel
+
+
+class _PhaseErrorBase(TypedDict):
+    status: Literal["error"]
+    error: str
+
+
+class PhaseError(_PhaseErrorBase, total=False):
+    traceback: str
+
+
+class Phase11Success(TypedDict):
+    status: Literal["success"]
+    phase: str
+    mcp_name: str
+    connection_tested: bool
+    message: str
+    config_validated: bool
+
+
+class Phase12Response(BaseModel):
+    """Phase 1.2 discovery payload
+
+    The largest handler response - a model rather than a TypedDict so
+    FastMCP can serialize it with model_dump_json in one pydantic-core
+    pass instead of re-encoding a plain dict.
+    """
+    status: str = "success"
+    phase: str = "1.2"
+    mcp_name: str
+    tools_count: int
+    tools: List[str]
+    schemas: List[Dict[str, Any]]
+    tools_file_path: str
+    message: str
+
+
+class Phase21Success(TypedDict):
+    status: Literal["success"]
+    phase: str
+    designs_file_path: str
+    message: str
+
+
+class Phase22Success(TypedDict):
+    status: Literal["success"]
+    phase: str
+    configs_directory: str
+    message: str
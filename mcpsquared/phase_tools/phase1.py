@@ -2,53 +2,54 @@
 
 import logging
 import traceback
+from itertools import islice
+from pathlib import Path
 from typing import List
-from mcp_use import MCPClient
+
+import aiofiles
+
+from mcpsquared.utils import fastjson
 from ..models.requests import MCPConfig
-from ..utils.helpers import _validate_mcp_config, _build_error_response, _save_tools_data
+from ..models.responses import Phase11Success, Phase12Response, PhaseError
+from ..utils.helpers import _validate_mcp_config, _build_error_response, _save_tools_data, _require_work_dir
+from ..utils.client_pool import pool
 
 logger = logging.getLogger(__name__)
 
 
 async def _validate_config_and_test_connection(mcp_config: MCPConfig) -> tuple[bool, str]:
     """Validate MCP config and test connection"""
-    config_dict = mcp_config.model_dump()
+    config_dict = mcp_config.as_dict
     if not _validate_mcp_config(config_dict):
         return False, "Invalid MCP configuration format"
-    
-    # Create MCPClient from user's config for testing
-    client_config = {"mcpServers": {mcp_config.name: config_dict}}
-    
-    # CONNECT and CHECK IF CAN GET TOOLS
-    logger.debug(f"Testing connection to MCP: {mcp_config.name}")
-    client = MCPClient.from_dict(client_config)
-    
+
+    # CONNECT and CHECK IF CAN GET TOOLS - pooled session stays open for Phase 1.2
+    logger.debug("Testing connection to MCP: %s", mcp_config.name)
+
     try:
-        session = await client.create_session(mcp_config.name)
-        
-        # Check if we can get tools using correct method
-        available_tools = await session.list_tools()
-        logger.debug(f"Successfully connected and found {len(available_tools)} tools")
+        # Check if we can get tools - cached so Phase 1.2 reuses this result
+        available_tools = await pool.list_tools_cached(mcp_config)
+        logger.debug("Successfully connected and found %s tools", len(available_tools))
         return True, "connection_tested: True, connection_resources: tool"
-            
+
     except Exception as e:
-        logger.error(f"Connection test failed: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.error("Connection test failed: %s\n%s", e, traceback.format_exc())
+        # Drop any pooled session for this signature so a retry respawns
+        # the MCP instead of reusing a dead transport
+        await pool.evict(mcp_config)
         return False, f"Connection failed: {str(e)}"
-    finally:
-        await client.close_all_sessions()
 
 
-def _build_success_response(mcp_name: str) -> dict:
+def _build_success_response(mcp_name: str) -> Phase11Success:
     """Build success response for phase 1.1"""
-    return {
-        "status": "success",
-        "phase": "1.1",
-        "mcp_name": mcp_name,
-        "connection_tested": True,
-        "message": f"Successfully validated configuration for {mcp_name} MCP",
-        "config_validated": True
-    }
+    return Phase11Success(
+        status="success",
+        phase="1.1",
+        mcp_name=mcp_name,
+        connection_tested=True,
+        message=f"Successfully validated configuration for {mcp_name} MCP",
+        config_validated=True
+    )
 
 
 async def phase1_1_install_mcp_tool(name: str, command: str, args: List[str]) -> dict:
@@ -66,7 +67,7 @@ async def phase1_1_install_mcp_tool(name: str, command: str, args: List[str]) ->
     # Reconstruct MCPConfig from flat parameters
     mcp_config = MCPConfig(name=name, command=command, args=args)
     
-    logger.info(f"Phase 1.1: Installing MCP {mcp_config.name}")
+    logger.info("Phase 1.1: Installing MCP %s", mcp_config.name)
     
     try:
         is_valid, message = await _validate_config_and_test_connection(mcp_config)
@@ -74,117 +75,105 @@ async def phase1_1_install_mcp_tool(name: str, command: str, args: List[str]) ->
             return _build_error_response(message)
         
         # Save MCP config for Phase 2.2 to use
-        _save_mcp_config(mcp_config)
+        await _save_mcp_config(mcp_config)
         
         return _build_success_response(mcp_config.name)
         
     except Exception as e:
-        logger.error(f"Phase 1.1 error: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        return _build_error_response(f"Phase 1.1 failed: {str(e)}", traceback.format_exc())
+        # Format the stack once and reuse it - format_exc walks every frame
+        tb = traceback.format_exc()
+        logger.error("Phase 1.1 error: %s\n%s", e, tb)
+        return _build_error_response(f"Phase 1.1 failed: {str(e)}", tb)
 
 
-async def phase1_2_list_mcp_tools_tool(name: str, command: str, args: List[str]) -> dict:
+async def phase1_2_list_mcp_tools_tool(
+    name: str, command: str, args: List[str], preview: bool = False
+) -> Phase12Response | PhaseError:
     """
     Phase 1.2: Connect to the REAL MCP and discover actual tools
-    
+
     Args:
         name: MCP server name
         command: Command to run MCP server
         args: Command arguments
-        
+        preview: Include the first few tools/schemas in the response
+
     Returns:
         Tool discovery results with schemas
     """
     # Reconstruct MCPConfig from flat parameters
     mcp_config = MCPConfig(name=name, command=command, args=args)
     
-    logger.info(f"Phase 1.2: Connecting to REAL MCP {mcp_config.name} to discover tools")
+    logger.info("Phase 1.2: Connecting to REAL MCP %s to discover tools", mcp_config.name)
     
     try:
         # Connect to the ACTUAL MCP and get REAL tools
         tools_data = await _discover_real_mcp_tools(mcp_config)
         
         # Save tools data to file for next phase
-        tools_file = _save_tools_data(mcp_config.name, tools_data)
+        tools_file = await _save_tools_data(mcp_config.name, tools_data)
         
-        return {
-            "status": "success",
-            "phase": "1.2", 
-            "mcp_name": mcp_config.name,
-            "tools_count": len(tools_data["tools"]),
-            "tools": tools_data["tools"][:5],  # First 5 for display
-            "schemas": tools_data["schemas"][:3] if tools_data.get("schemas") else [],
-            "tools_file_path": tools_file,
-            "message": f"Discovered {len(tools_data['tools'])} REAL tools from {mcp_config.name}"
-        }
+        # The full listing lives in the tools file; previews are opt-in so
+        # the wire payload stays small and no display copies are made
+        return Phase12Response(
+            mcp_name=mcp_config.name,
+            tools_count=len(tools_data["tools"]),
+            tools=list(islice(tools_data["tools"], 5)) if preview else [],
+            schemas=list(islice(tools_data["schemas"], 3)) if preview else [],
+            tools_file_path=tools_file,
+            message=f"Discovered {len(tools_data['tools'])} REAL tools from {mcp_config.name}"
+        )
         
     except Exception as e:
-        logger.error(f"Phase 1.2 error: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        return _build_error_response(f"Phase 1.2 failed: {str(e)}", traceback.format_exc())
+        tb = traceback.format_exc()
+        logger.error("Phase 1.2 error: %s\n%s", e, tb)
+        # The pooled session may be the failure - evict it so a retry gets
+        # a fresh subprocess
+        await pool.evict(mcp_config)
+        return _build_error_response(f"Phase 1.2 failed: {str(e)}", tb)
 
 
 async def _discover_real_mcp_tools(mcp_config: MCPConfig) -> dict:
     """Connect to REAL MCP and discover ACTUAL tools"""
-    logger.info(f"Connecting to REAL MCP {mcp_config.name} to discover tools")
-    
-    # Create MCPClient with the user's MCP config
-    client_config = {
-        "mcpServers": {
-            mcp_config.name: mcp_config.model_dump()
+    logger.info("Connecting to REAL MCP %s to discover tools", mcp_config.name)
+
+    # Cached listing - reuses the result Phase 1.1's validation already fetched
+    available_tools = await pool.list_tools_cached(mcp_config)
+
+    # Preallocate and precompute the shared prefix - keeps the per-tool work
+    # to one concatenation and two getattr calls
+    prefix = f"mcp__{mcp_config.name}__"
+    n = len(available_tools)
+    tools = [None] * n
+    schemas = [None] * n
+    for i, tool in enumerate(available_tools):
+        # Use prefixed naming convention: mcp__{{name}}__{{tool}}
+        prefixed_name = prefix + tool.name
+        tools[i] = prefixed_name
+        schemas[i] = {
+            "name": prefixed_name,
+            "description": getattr(tool, 'description', "") or "",
+            "parameters": getattr(tool, 'inputSchema', None) or {}
         }
+
+    logger.info("Discovered %s REAL tools from %s", len(tools), mcp_config.name)
+
+    return {
+        "mcp_name": mcp_config.name,
+        "tools": tools,
+        "schemas": schemas
     }
-    
-    client = MCPClient.from_dict(client_config)
-    
-    try:
-        # Create session and get REAL tools
-        session = await client.create_session(mcp_config.name)
-        
-        tools = []
-        schemas = []
-        
-        # Use session.list_tools() method to get actual tools
-        available_tools = await session.list_tools()
-        for tool in available_tools:
-            # Use prefixed naming convention: mcp__{{name}}__{{tool}}
-            prefixed_name = f"mcp__{mcp_config.name}__{tool.name}"
-            tools.append(prefixed_name)
-            schemas.append({
-                "name": prefixed_name,
-                "description": tool.description if hasattr(tool, 'description') else "",
-                "parameters": tool.inputSchema if hasattr(tool, 'inputSchema') else {}
-            })
-        
-        logger.info(f"Discovered {len(tools)} REAL tools from {mcp_config.name}")
-        
-        return {
-            "mcp_name": mcp_config.name,
-            "tools": tools,
-            "schemas": schemas
-        }
-        
-    finally:
-        await client.close_all_sessions()
 
 
-def _save_mcp_config(mcp_config: MCPConfig) -> None:
+async def _save_mcp_config(mcp_config: MCPConfig) -> None:
     """Save MCP config to registry for Phase 2.2 to use"""
-    import json
-    import os
-    from pathlib import Path
-    
     # Create mcp_configs directory
-    work_dir = os.getenv("WORK_DIR")
-    if not work_dir:
-        raise ValueError("WORK_DIR environment variable not set")
-    mcp_configs_dir = Path(f"{work_dir}/mcp_configs")
+    mcp_configs_dir = Path(f"{_require_work_dir()}/mcp_configs")
     mcp_configs_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Save MCP config
+
+    # Save MCP config - one serialized buffer, one awaited write
     config_file = mcp_configs_dir / f"{mcp_config.name}_config.json"
-    with open(config_file, 'w') as f:
-        json.dump(mcp_config.model_dump(), f, indent=2)
-    
-    logger.info(f"Saved MCP config to: {config_file}")
\ No newline at end of file
+    async with aiofiles.open(config_file, 'wb') as f:
+        await f.write(fastjson.dump_bytes(mcp_config.as_dict))
+
+    logger.info("Saved MCP config to: %s", config_file)
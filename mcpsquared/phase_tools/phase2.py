@@ -1,18 +1,39 @@
 """Phase 2: Workflow Design (design workflows, create agent configs)"""
 
+import importlib.util
 import logging
 import traceback
 import re
 import os
+import sys
 from ..models.requests import ToolsFileRequest, DesignsFileRequest
+from ..models.responses import Phase21Success, Phase22Success
 from ..utils.helpers import _load_tools_data, _build_error_response
 from ..agents.subagents import _design_workflows_with_subagent, _create_agent_configs_with_subagent
 
+# Compiled once - these run against every subagent response
+_WORKFLOW_PATH_RE = re.compile(r"Workflows written to ([^\n]+)", re.ASCII)
+_CONFIGS_PATH_RE = re.compile(r"Agent configs written to ([^\n]+)", re.ASCII)
+
+# Loaded at most once per process by debug_schema_import_test
+_SCHEMA_TOOLS_MODULE = None
+
+
+def _load_schema_tools_module(schema_dir: str):
+    """Load schema_tools straight from its file, cached, without touching sys.path"""
+    global _SCHEMA_TOOLS_MODULE
+    if _SCHEMA_TOOLS_MODULE is None:
+        spec = importlib.util.spec_from_file_location("schema_tools", f"{schema_dir}/schema_tools.py")
+        if spec is None or spec.loader is None:
+            raise ImportError(f"No schema_tools module found in {schema_dir}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _SCHEMA_TOOLS_MODULE = module
+    return _SCHEMA_TOOLS_MODULE
+
 
 async def debug_environment_tool() -> dict:
     """Debug tool to check environment variables in Phase Tools MCP server"""
-    import os
-    import sys
     return {
         "status": "success",
         "environment": {
@@ -35,47 +56,41 @@ async def debug_environment_tool() -> dict:
 async def debug_schema_import_test() -> dict:
     """Test if Phase Tools can import schema server files when running nested"""
     import_results = {}
-    import sys
-    import os
-    
-    # Test if we can find the schema server directory
-    schema_paths_to_test = [
-        "/home/GOD/mcpsquared_separated/schema_mcp",
-        "/home/GOD/mcpsquared_separated/schema_mcp/schema_tools_mcp_server.py",
-        "/home/GOD/mcpsquared_separated/schema_mcp/schema_tools.py"
-    ]
-    
-    for path in schema_paths_to_test:
-        if os.path.exists(path):
-            import_results[f"path_exists_{path}"] = "SUCCESS"
-        else:
-            import_results[f"path_exists_{path}"] = "FAILED - PATH NOT FOUND"
+
+    # Test if we can find the schema server directory - one scandir pass
+    # instead of a stat syscall per path
+    base = "/home/GOD/mcpsquared_separated/schema_mcp"
+    try:
+        entries = {e.name for e in os.scandir(base)}
+        import_results[f"path_exists_{base}"] = "SUCCESS"
+        for fname in ("schema_tools_mcp_server.py", "schema_tools.py"):
+            key = f"path_exists_{base}/{fname}"
+            import_results[key] = "SUCCESS" if fname in entries else "FAILED - PATH NOT FOUND"
+    except FileNotFoundError:
+        import_results[f"path_exists_{base}"] = "FAILED - PATH NOT FOUND"
     
-    # Test if we can import schema_tools when schema_mcp is in sys.path
+    # Test if we can import schema_tools - loaded straight from its file so
+    # sys.path stays clean and repeat calls reuse the cached module
     try:
-        # Add schema_mcp to path temporarily
-        schema_dir = "/home/GOD/mcpsquared_separated/schema_mcp"
-        if schema_dir not in sys.path:
-            sys.path.insert(0, schema_dir)
-            
-        import schema_tools
+        schema_tools = _load_schema_tools_module(base)
         import_results["schema_tools_import"] = "SUCCESS"
-        
+
         # Test specific schema functions
-        from schema_tools import create_workflow_config
-        import_results["create_workflow_config_import"] = "SUCCESS"
-        
+        if hasattr(schema_tools, "create_workflow_config"):
+            import_results["create_workflow_config_import"] = "SUCCESS"
+        else:
+            import_results["create_workflow_config_import"] = "FAILED: attribute not found"
+
     except Exception as e:
-        import traceback
         import_results["schema_tools_import"] = f"FAILED: {str(e)}"
         import_results["schema_tools_import_traceback"] = traceback.format_exc()
-    
+
     return {
         "status": "schema_import_test_complete",
         "import_results": import_results,
         "current_directory": os.getcwd(),
         "python_path_first_5": sys.path[:5],
-        "schema_mcp_in_path": "/home/GOD/mcpsquared_separated/schema_mcp" in sys.path
+        "schema_mcp_in_path": base in sys.path
     }
 
 logger = logging.getLogger(__name__)
@@ -92,15 +107,15 @@ async def phase2_1_call_workflow_designer_subagent_tool(tools_file_path: str, us
     Returns:
         Workflow design results
     """
-    logger.info(f"Phase 2.1: Designing workflows from tools file: {tools_file_path}")
+    logger.info("Phase 2.1: Designing workflows from tools file: %s", tools_file_path)
     
     # DEBUG: Check environment variables
-    import os
-    logger.info(f"DEBUG - Environment variables:")
-    logger.info(f"  OPENAI_API_KEY: {'SET' if os.getenv('OPENAI_API_KEY') else 'NOT SET'}")
-    logger.info(f"  SCHEMA_MCP_SERVER_PATH: {os.getenv('SCHEMA_MCP_SERVER_PATH', 'NOT SET')}")
-    logger.info(f"  WORK_DIR: {os.getenv('WORK_DIR', 'NOT SET')}")
-    logger.info(f"  Current working directory: {os.getcwd()}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("DEBUG - Environment variables:")
+        logger.info("  OPENAI_API_KEY: %s", 'SET' if os.getenv('OPENAI_API_KEY') else 'NOT SET')
+        logger.info("  SCHEMA_MCP_SERVER_PATH: %s", os.getenv('SCHEMA_MCP_SERVER_PATH', 'NOT SET'))
+        logger.info("  WORK_DIR: %s", os.getenv('WORK_DIR', 'NOT SET'))
+        logger.info("  Current working directory: %s", os.getcwd())
     
     try:
         # Load tools data
@@ -112,17 +127,18 @@ async def phase2_1_call_workflow_designer_subagent_tool(tools_file_path: str, us
         # Agent writes files directly - extract path from response
         designs_file = _extract_file_path_from_response(workflow_designs, tools_file_path, tools_data)
         
-        return {
-            "status": "success",
-            "phase": "2.1",
-            "designs_file_path": designs_file,
-            "message": "Workflow designs generated using LLM subagent"
-        }
+        return Phase21Success(
+            status="success",
+            phase="2.1",
+            designs_file_path=designs_file,
+            message="Workflow designs generated using LLM subagent"
+        )
         
     except Exception as e:
-        logger.error(f"Phase 2.1 error: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        return _build_error_response(f"Phase 2.1 failed: {str(e)}", traceback.format_exc())
+        # Format the stack once and reuse it - format_exc walks every frame
+        tb = traceback.format_exc()
+        logger.error("Phase 2.1 error: %s\n%s", e, tb)
+        return _build_error_response(f"Phase 2.1 failed: {str(e)}", tb)
 
 
 async def phase2_2_call_agent_designer_subagent_tool(designs_file_path: str) -> dict:
@@ -135,7 +151,7 @@ async def phase2_2_call_agent_designer_subagent_tool(designs_file_path: str) ->
     Returns:
         Agent configuration results
     """
-    logger.info(f"Phase 2.2: Creating agent configs from designs: {designs_file_path}")
+    logger.info("Phase 2.2: Creating agent configs from designs: %s", designs_file_path)
     
     try:
         # Agent will read the workflow designs file directly via filesystem MCP
@@ -144,22 +160,22 @@ async def phase2_2_call_agent_designer_subagent_tool(designs_file_path: str) ->
         # Agent writes files directly - extract path from response
         configs_dir = _extract_configs_dir_from_response(agent_configs, designs_file_path)
         
-        return {
-            "status": "success",
-            "phase": "2.2",
-            "configs_directory": configs_dir,
-            "message": "Agent configurations generated using LLM subagent"
-        }
+        return Phase22Success(
+            status="success",
+            phase="2.2",
+            configs_directory=configs_dir,
+            message="Agent configurations generated using LLM subagent"
+        )
         
     except Exception as e:
-        logger.error(f"Phase 2.2 error: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        return _build_error_response(f"Phase 2.2 failed: {str(e)}", traceback.format_exc())
+        tb = traceback.format_exc()
+        logger.error("Phase 2.2 error: %s\n%s", e, tb)
+        return _build_error_response(f"Phase 2.2 failed: {str(e)}", tb)
 
 
 def _extract_file_path_from_response(workflow_designs: str, tools_file_path: str, tools_data: dict) -> str:
     """Extract file path from workflow designs response"""
-    path_match = re.search(r"Workflows written to ([^\n]+)", workflow_designs)
+    path_match = _WORKFLOW_PATH_RE.search(workflow_designs)
     if path_match:
         return path_match.group(1).strip()
     else:
@@ -170,7 +186,7 @@ def _extract_file_path_from_response(workflow_designs: str, tools_file_path: str
 
 def _extract_configs_dir_from_response(agent_configs: str, designs_file_path: str) -> str:
     """Extract configs directory from agent configs response"""
-    path_match = re.search(r"Agent configs written to ([^\n]+)", agent_configs)
+    path_match = _CONFIGS_PATH_RE.search(agent_configs)
     if path_match:
         return path_match.group(1).strip()
     else:
@@ -9,21 +9,25 @@ Implements the 7 phase tools for MCPSquared workflow generation:
 
 import os
 import sys
+from contextlib import asynccontextmanager
 from fastmcp import FastMCP
 import logging
 
-# CRITICAL: Immediately validate API key is available in environment
+# CRITICAL: Immediately validate API key is available in environment.
+# any() short-circuits on the first hit - the full list is only built for
+# the success log below, keeping stdio re-spawn import time down.
 API_KEY_VARS = ["OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY", "AZURE_OPENAI_API_KEY"]
-found_keys = [var for var in API_KEY_VARS if os.getenv(var)]
 
-if not found_keys:
+if not any(os.getenv(var) for var in API_KEY_VARS):
     print(f"FATAL ERROR: No API keys found in environment!", file=sys.stderr)
     print(f"Phase tools server requires at least one of: {API_KEY_VARS}", file=sys.stderr)
     print(f"Current environment keys: {[k for k in os.environ.keys() if 'KEY' in k]}", file=sys.stderr)
     sys.exit(1)
 
 logger = logging.getLogger(__name__)
-logger.info(f"Phase tools server starting with API keys: {found_keys}")
+if logger.isEnabledFor(logging.INFO):
+    logger.info("Phase tools server starting with API keys: %s",
+                [var for var in API_KEY_VARS if os.getenv(var)])
 
 # Import modular components
 from .models.requests import (
@@ -31,12 +35,25 @@ from .models.requests import (
 )
 from .phases.phase1 import phase1_1_install_mcp_tool, phase1_2_list_mcp_tools_tool
 from .phases.phase2 import phase2_1_call_workflow_designer_subagent_tool, phase2_2_call_agent_designer_subagent_tool, debug_environment_tool, debug_schema_import_test
+from .utils.client_pool import shutdown
+
+
+@asynccontextmanager
+async def _lifespan(server):
+    """Close the pooled MCP sessions on the serving loop at shutdown.
+
+    The pool's lock and stdio transports are bound to the loop that first
+    awaited them, so cleanup has to run there - a fresh asyncio.run() loop
+    after app.run() returns would raise instead of closing anything.
+    """
+    try:
+        yield
+    finally:
+        await shutdown()
 
-# Setup logging
-logger = logging.getLogger(__name__)
 
 # Create FastMCP app
-app = FastMCP("MCPSquared Phase Tools")
+app = FastMCP("MCPSquared Phase Tools", lifespan=_lifespan)
 
 # Register phase tools
 app.tool()(phase1_1_install_mcp_tool)
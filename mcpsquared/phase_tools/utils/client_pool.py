@@ -0,0 +1,116 @@
+"""Persistent MCPClient session pool for phase tools"""
+
+import asyncio
+import logging
+from typing import Dict
+
+from mcp_use import MCPClient
+
+from mcpsquared.utils.caching import TTLCache
+from ..models.requests import MCPConfig
+
+logger = logging.getLogger(__name__)
+
+
+class MCPClientPool:
+    """
+    Lazily-created MCP sessions keyed by (name, command, args).
+
+    Phase 1.1 and 1.2 run back-to-back against the same MCP config, so the
+    stdio spawn + JSON-RPC initialize handshake is paid once and the session
+    stays open until explicit shutdown instead of closing after every call.
+    """
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._clients: Dict[tuple, MCPClient] = {}
+        self._sessions: Dict[tuple, object] = {}
+        self._tools_cache = TTLCache(maxsize=64, ttl=60.0)
+
+    @staticmethod
+    def _key(mcp_config: MCPConfig) -> tuple:
+        return (mcp_config.name, mcp_config.command, tuple(mcp_config.args))
+
+    async def get_session(self, mcp_config: MCPConfig):
+        """Get the pooled session for this config, creating it on first use"""
+        key = self._key(mcp_config)
+        async with self._lock:
+            if key in self._sessions:
+                logger.debug(f"Reusing pooled session for {mcp_config.name}")
+                return self._sessions[key]
+
+            client_config = {"mcpServers": {mcp_config.name: mcp_config.as_dict}}
+            client = MCPClient.from_dict(client_config)
+            try:
+                session = await client.create_session(mcp_config.name)
+            except BaseException:
+                # Don't leak the half-spawned subprocess when the handshake fails
+                try:
+                    await client.close_all_sessions()
+                except Exception as close_err:
+                    logger.debug(f"Cleanup of failed session for {mcp_config.name} failed: {close_err}")
+                raise
+
+            self._clients[key] = client
+            self._sessions[key] = session
+            logger.debug(f"Opened pooled session for {mcp_config.name}")
+            return session
+
+    async def evict(self, mcp_config: MCPConfig) -> None:
+        """Drop the pooled session for a config whose MCP stopped responding.
+
+        Without eviction a dead subprocess poisons every retry for the same
+        signature until the server restarts; dropping the entry makes the
+        next call respawn it.
+        """
+        key = self._key(mcp_config)
+        async with self._lock:
+            client = self._clients.pop(key, None)
+            self._sessions.pop(key, None)
+            self._tools_cache.pop(key)
+        if client is None:
+            return
+        try:
+            await client.close_all_sessions()
+        except Exception as e:
+            logger.debug(f"Closing evicted session for {mcp_config.name} failed: {e}")
+
+    async def list_tools_cached(self, mcp_config: MCPConfig) -> list:
+        """
+        list_tools with a short-TTL memo per config.
+
+        Phase 1.1 validates the connection by listing tools and Phase 1.2
+        lists them again immediately after - the memo collapses that into
+        one round-trip.
+        """
+        key = self._key(mcp_config)
+        tools = self._tools_cache.get(key)
+        if tools is not None:
+            logger.debug(f"list_tools cache hit for {mcp_config.name}")
+            return tools
+
+        session = await self.get_session(mcp_config)
+        tools = await session.list_tools()
+        self._tools_cache.set(key, tools)
+        return tools
+
+    async def close_all(self) -> None:
+        """Close every pooled client session"""
+        async with self._lock:
+            for client in self._clients.values():
+                await client.close_all_sessions()
+            self._clients.clear()
+            self._sessions.clear()
+
+
+pool = MCPClientPool()
+
+
+async def shutdown() -> None:
+    """Close every pooled client - the server's lifespan hook calls this.
+
+    Shutdown must run on the serving loop: the pool's lock and stdio
+    transports are bound to it, so no atexit-style fallback on a fresh
+    event loop could ever close them.
+    """
+    await pool.close_all()
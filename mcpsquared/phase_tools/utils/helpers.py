@@ -1,12 +1,27 @@
 """Helper functions for phase tools"""
 
-import json
 import os
 import logging
-from datetime import datetime
+import time
+
+import aiofiles
+import aiofiles.os
+
+from mcpsquared.utils import fastjson
+from ..models.responses import PhaseError
 
 logger = logging.getLogger(__name__)
 
+# WORK_DIR never changes within a process - resolve it once at import
+_WORK_DIR = os.getenv("WORK_DIR")
+
+
+def _require_work_dir() -> str:
+    """Return the cached WORK_DIR, raising if it was never configured"""
+    if not _WORK_DIR:
+        raise ValueError("WORK_DIR environment variable not set")
+    return _WORK_DIR
+
 
 def _validate_mcp_config(config: dict) -> bool:
     """Validate MCP configuration format"""
@@ -14,40 +29,35 @@ def _validate_mcp_config(config: dict) -> bool:
     return all(field in config for field in required_fields)
 
 
-def _build_error_response(error_msg: str, traceback_info: str = None) -> dict:
+def _build_error_response(error_msg: str, traceback_info: str = None) -> PhaseError:
     """Build standardized error response"""
-    response = {
-        "status": "error",
-        "error": error_msg
-    }
+    response = PhaseError(status="error", error=error_msg)
     if traceback_info:
         response["traceback"] = traceback_info
     return response
 
-def _save_tools_data(mcp_name: str, tools_data: dict) -> str:
-    """Save tools data to timestamped project directory"""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    work_dir = os.getenv("WORK_DIR")
-    if not work_dir:
-        raise ValueError("WORK_DIR environment variable not set")
+async def _save_tools_data(mcp_name: str, tools_data: dict) -> str:
+    """Save tools data to timestamped project directory without blocking the event loop"""
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    work_dir = _require_work_dir()
     project_dir = os.path.join(work_dir, f"{mcp_name}_project_{timestamp}")
-    os.makedirs(project_dir, exist_ok=True)
+    await aiofiles.os.makedirs(project_dir, exist_ok=True)
     file_path = os.path.join(project_dir, f"mcp_tools_{mcp_name}.json")
-    
-    logger.debug(f"Saving tools data for {mcp_name} to {file_path}")
-    with open(file_path, 'w') as f:
-        json.dump(tools_data, f, indent=2)
-    logger.info(f"Tools data saved to {file_path}")
-    
+
+    logger.debug("Saving tools data for %s to %s", mcp_name, file_path)
+    # Serialize once with orjson, then hand the event loop a single write
+    async with aiofiles.open(file_path, 'wb') as f:
+        await f.write(fastjson.dump_bytes(tools_data))
+    logger.info("Tools data saved to %s", file_path)
+
     return file_path
 
 
 def _load_tools_data(file_path: str) -> dict:
     """Load tools data from file"""
-    logger.debug(f"Loading tools data from {file_path}")
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    logger.info(f"Loaded tools data for {data.get('mcp_name', 'unknown')}")
+    logger.debug("Loading tools data from %s", file_path)
+    data = fastjson.load_file(file_path)
+    logger.info("Loaded tools data for %s", data.get('mcp_name', 'unknown'))
     return data
 
 
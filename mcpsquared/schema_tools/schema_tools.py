@@ -2,14 +2,18 @@
 Schema-enforced tools for creating workflow and agent configurations
 """
 
-import json
+import functools
 import os
+import re
 import traceback
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import logging
 
+from pydantic import TypeAdapter
+
+from mcpsquared.utils import fastjson
 from schema_mcp.models.schemas import (
     WorkflowConfig, AgentConfig, WorkflowDesigns, AgentConfigs,
     TemplatedArg, MCPClientConfig, MCPServerConfig
@@ -17,25 +21,41 @@ from schema_mcp.models.schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Compiled once - validates whole files in pydantic-core instead of
+# building one model at a time
+_WORKFLOW_LIST_ADAPTER = TypeAdapter(List[WorkflowConfig])
+_AGENT_ADAPTER = TypeAdapter(AgentConfig)
+
+# Splits comma-separated agent inputs and eats surrounding whitespace in
+# the same pass
+_CSV_SPLIT = re.compile(r"\s*,\s*").split
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_mcp_names_cached(allowed_tools: tuple) -> tuple:
+    """Memoized extraction core - agent config loops repeat the same tool sets"""
+    # Slice the name out directly instead of split() - no throwaway lists,
+    # and the dict dedups while preserving first-seen order
+    seen = {}
+    for tool in allowed_tools:
+        if tool.startswith("mcp__"):
+            j = tool.find("__", 5)  # mcp__name__tool
+            if j > 5:
+                seen[tool[5:j]] = None
+    return tuple(seen)
+
 
 def extract_mcp_names_from_tools(allowed_tools: List[str]) -> List[str]:
     """
     Extract unique MCP names from prefixed tool names
-    
+
     Args:
         allowed_tools: List of prefixed tool names like ["mcp__carton__add_concept", "mcp__carton__query_wiki_graph"]
-        
+
     Returns:
         List of unique MCP names like ["carton"]
     """
-    mcp_names = set()
-    for tool in allowed_tools:
-        if tool.startswith("mcp__"):
-            parts = tool.split("__")
-            if len(parts) >= 3:  # mcp__name__tool
-                mcp_name = parts[1]
-                mcp_names.add(mcp_name)
-    return list(mcp_names)
+    return list(_extract_mcp_names_cached(tuple(allowed_tools)))
 
 
 def create_workflow_config(
@@ -62,7 +82,7 @@ def create_workflow_config(
     Returns:
         Validated WorkflowConfig object
     """
-    logger.debug(f"Creating workflow config for: {workflow_name}")
+    logger.debug("Creating workflow config for: %s", workflow_name)
     
     # Convert templated_args dicts to TemplatedArg objects
     template_args = [TemplatedArg(**arg) for arg in (templated_args or [])]
@@ -77,7 +97,7 @@ def create_workflow_config(
         domain=domain
     )
     
-    logger.debug(f"Successfully created workflow config: {workflow_name}")
+    logger.debug("Successfully created workflow config: %s", workflow_name)
     return workflow
 
 
@@ -103,11 +123,11 @@ def create_agent_config(
     Returns:
         Validated AgentConfig object with mcp_names list for loader to resolve
     """
-    logger.debug(f"Creating agent config for: {agent_name}")
+    logger.debug("Creating agent config for: %s", agent_name)
     
     # Extract MCP names from prefixed tool names
     mcp_names = extract_mcp_names_from_tools(allowed_tools)
-    logger.debug(f"Extracted MCP names from tools: {mcp_names}")
+    logger.debug("Extracted MCP names from tools: %s", mcp_names)
     
     agent = AgentConfig(
         agent_name=agent_name,
@@ -119,7 +139,7 @@ def create_agent_config(
         max_steps=max_steps
     )
     
-    logger.debug(f"Successfully created agent config: {agent_name}")
+    logger.debug("Successfully created agent config: %s", agent_name)
     return agent
 
 
@@ -147,14 +167,14 @@ def create_agent_config_from_strings(
     Returns:
         Validated AgentConfig object with mcp_names
     """
-    logger.debug(f"Creating agent config from strings for: {agent_name}")
+    logger.debug("Creating agent config from strings for: %s", agent_name)
     
-    # Parse comma-separated strings
-    mcp_names = [name.strip() for name in mcp_names_str.split(',') if name.strip()]
-    allowed_tools = [tool.strip() for tool in allowed_tools_str.split(',') if tool.strip()]
+    # Parse comma-separated strings - one regex pass strips and splits together
+    mcp_names = [name for name in _CSV_SPLIT(mcp_names_str.strip()) if name]
+    allowed_tools = [tool for tool in _CSV_SPLIT(allowed_tools_str.strip()) if tool]
     
-    logger.debug(f"Parsed MCP names: {mcp_names}")
-    logger.debug(f"Parsed allowed tools: {allowed_tools}")
+    logger.debug("Parsed MCP names: %s", mcp_names)
+    logger.debug("Parsed allowed tools: %s", allowed_tools)
     
     agent = AgentConfig(
         agent_name=agent_name,
@@ -166,7 +186,7 @@ def create_agent_config_from_strings(
         max_steps=max_steps
     )
     
-    logger.debug(f"Successfully created agent config from strings: {agent_name}")
+    logger.debug("Successfully created agent config from strings: %s", agent_name)
     return agent
 
 
@@ -186,7 +206,7 @@ def write_workflow_designs_file(
     Returns:
         Result dict with status and file path
     """
-    logger.info(f"Writing {len(workflows)} workflow designs to: {file_path}")
+    logger.info("Writing %s workflow designs to: %s", len(workflows), file_path)
     
     try:
         # Ensure directory exists
@@ -199,11 +219,10 @@ def write_workflow_designs_file(
             generated_at=datetime.now().isoformat()
         )
         
-        # Write to file
-        with open(file_path, 'w') as f:
-            json.dump(designs.to_json_list(), f, indent=2)
+        # Write to file - orjson serializes straight to indented bytes
+        fastjson.dump_file(designs.to_json_list(), file_path)
         
-        logger.info(f"Successfully wrote workflow designs to: {file_path}")
+        logger.info("Successfully wrote workflow designs to: %s", file_path)
         return {
             "status": "success",
             "file_path": file_path,
@@ -212,12 +231,13 @@ def write_workflow_designs_file(
         }
         
     except Exception as e:
-        logger.error(f"Failed to write workflow designs: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        # Format the stack once and reuse it - format_exc walks every frame
+        tb = traceback.format_exc()
+        logger.error("Failed to write workflow designs: %s\n%s", e, tb)
         return {
             "status": "error",
             "error": str(e),
-            "traceback": traceback.format_exc(),
+            "traceback": tb,
             "file_path": file_path
         }
 
@@ -248,7 +268,7 @@ def write_agent_configs_directory(
     Returns:
         Result dict with status and file path
     """
-    logger.info(f"Creating agent config file for: {agent_name}")
+    logger.info("Creating agent config file for: %s", agent_name)
     
     try:
         # Ensure directory exists
@@ -268,10 +288,9 @@ def write_agent_configs_directory(
         # Write config file
         filename = f"{agent_name}.json"
         file_path = os.path.join(directory_path, filename)
-        with open(file_path, 'w') as f:
-            json.dump(config_data, f, indent=2)
+        fastjson.dump_file(config_data, file_path)
         
-        logger.info(f"Successfully wrote agent config to: {file_path}")
+        logger.info("Successfully wrote agent config to: %s", file_path)
         return {
             "status": "success",
             "directory_path": directory_path,
@@ -281,12 +300,12 @@ def write_agent_configs_directory(
         }
         
     except Exception as e:
-        logger.error(f"Failed to write agent configs: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        tb = traceback.format_exc()
+        logger.error("Failed to write agent configs: %s\n%s", e, tb)
         return {
             "status": "error",
             "error": str(e),
-            "traceback": traceback.format_exc(),
+            "traceback": tb,
             "directory_path": directory_path
         }
 
@@ -301,16 +320,14 @@ def validate_workflow_json(file_path: str) -> Dict[str, Any]:
     Returns:
         Validation result dict
     """
-    logger.info(f"Validating workflow JSON: {file_path}")
+    logger.info("Validating workflow JSON: %s", file_path)
     
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        
-        # Validate each workflow in the list
-        workflows = [WorkflowConfig(**workflow) for workflow in data]
+        # Parse and validate in one pass - no intermediate dict stage
+        with open(file_path, 'rb') as f:
+            workflows = _WORKFLOW_LIST_ADAPTER.validate_json(f.read())
         
-        logger.info(f"Successfully validated {len(workflows)} workflows in: {file_path}")
+        logger.info("Successfully validated %s workflows in: %s", len(workflows), file_path)
         return {
             "status": "valid",
             "workflow_count": len(workflows),
@@ -318,12 +335,12 @@ def validate_workflow_json(file_path: str) -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"Validation failed for {file_path}: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        tb = traceback.format_exc()
+        logger.error("Validation failed for %s: %s\n%s", file_path, e, tb)
         return {
             "status": "invalid",
             "error": str(e),
-            "traceback": traceback.format_exc(),
+            "traceback": tb,
             "file_path": file_path
         }
 
@@ -338,16 +355,14 @@ def validate_agent_json(file_path: str) -> Dict[str, Any]:
     Returns:
         Validation result dict
     """
-    logger.info(f"Validating agent JSON: {file_path}")
+    logger.info("Validating agent JSON: %s", file_path)
     
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        
-        # Validate agent config
-        agent = AgentConfig(**data)
+        # Parse and validate in one pass - no intermediate dict stage
+        with open(file_path, 'rb') as f:
+            agent = _AGENT_ADAPTER.validate_json(f.read())
         
-        logger.info(f"Successfully validated agent config: {file_path}")
+        logger.info("Successfully validated agent config: %s", file_path)
         return {
             "status": "valid",
             "agent_name": agent.agent_name,
@@ -355,11 +370,11 @@ def validate_agent_json(file_path: str) -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"Validation failed for {file_path}: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        tb = traceback.format_exc()
+        logger.error("Validation failed for %s: %s\n%s", file_path, e, tb)
         return {
             "status": "invalid",
             "error": str(e),
-            "traceback": traceback.format_exc(),
+            "traceback": tb,
             "file_path": file_path
         }
\ No newline at end of file
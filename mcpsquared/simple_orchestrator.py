@@ -4,16 +4,101 @@ Just runs one agent with the merged MCP server
 """
 
 import os
-import json
+import sys
 import asyncio
+import hashlib
 import logging
-from typing import Dict, Any
+import re
+import traceback
+from typing import Dict, Any, List, Optional
 from mcp_use import MCPClient, MCPAgent
 from langchain_openai import ChatOpenAI
 
+# mcpsquared-base is a normal installed dependency; MCPSQUARED_BASE_PATH is a
+# dev-mode escape hatch for running against an uninstalled checkout
+try:
+    from mcpsquared_base.models.schemas import InputArgs, InputArg
+    from mcpsquared_base.utils.workflow_runner import run_workflow
+    from mcpsquared_base.utils.debug import mcp_debug_log
+except ImportError:
+    _base_path = os.getenv("MCPSQUARED_BASE_PATH")
+    if not _base_path:
+        raise
+    sys.path.insert(0, _base_path)
+    from mcpsquared_base.models.schemas import InputArgs, InputArg
+    from mcpsquared_base.utils.workflow_runner import run_workflow
+    from mcpsquared_base.utils.debug import mcp_debug_log
+
+from mcpsquared import merged_mcp_server as _merged
+from mcpsquared import index as _index
+from mcpsquared.utils import fastjson
+from mcpsquared.utils.batcher import AsyncBatcher
+
 # Do not call basicConfig in library code
 logger = logging.getLogger(__name__)
 
+# Resolved once - every orchestrator spawns the same merged server
+_SERVER_PATH = _merged.__file__
+
+# Env vars are fixed for the process lifetime - read them once at import
+# instead of hitting os.environ on every call
+_WORK_DIR = os.getenv("WORK_DIR")
+_DEFAULT_WORK_DIR = _WORK_DIR or "/tmp/mcpsquared"
+_DEBUG_PATH = os.getenv("PHASE_SERVER_DEBUG_PATH")
+_DEBUG_NICK = os.getenv("PHASE_SERVER_DEBUG_NICKNAME")
+_OPENAI_KEY = os.getenv("OPENAI_API_KEY")
+
+# Canned responses for the not-yet-implemented stubs - built once so each
+# stub call is a single constant load
+_ERR_SUB_CHAT = '{"error": "sub_chat not implemented in alpha version"}'
+_ERR_PACKAGE_WORKFLOW_MCP = '{"error": "package_workflow_mcp not implemented in alpha version"}'
+_ERR_DOMAIN_SPECIFIC_AGENT = '{"error": "domain_specific_agent not implemented in alpha version"}'
+
+# Traceback capture is opt-in - format_exc walks every frame and builds a
+# multi-kilobyte string, which adds up under failure storms
+_INCLUDE_TB = os.getenv("MCPSQUARED_INCLUDE_TRACEBACK", "0") == "1"
+
+_SYSTEM_PROMPT = """You are MCPSquared workflow generator. Execute the 4 phase tools in sequence:
+
+1. Call phase1_1_install_mcp_tool to test connection
+2. Call phase1_2_list_mcp_tools_tool to discover tools (save the tools_file_path)
+3. Call phase2_1_create_workflow_configs with the tools_file_path (save the workflows_directory)
+4. Call phase2_2_create_agent_configs with the workflows_directory
+
+Return the final project directory path when complete."""
+
+# Invariant instructions lead the user message so the provider's prefix
+# cache covers system prompt + this header; only the MCP details vary
+_EXECUTION_PROMPT_PREFIX = """Generate workflows for this MCP.
+
+Execute all 4 phases and return the project directory.
+
+MCP details:
+"""
+
+# Plan-cache records live under WORK_DIR; absolute paths in a cached agent
+# result are re-checked on disk before the hit is trusted
+_PLAN_CACHE_DIRNAME = ".mcpsquared_plan_cache"
+_PATH_TOKEN_RE = re.compile(r"/[\w./-]+")
+
+# Success markers in agent output - compiled once, one scan per result
+_SUCCESS_RE = re.compile(r"project_complete|configs_directory")
+
+# Per-phase progress markers in streamed agent output - each phase tool
+# reports exactly one of these paths when it completes
+_PHASE_MARKER_RE = re.compile(r"(tools_file_path|workflows_directory|configs_directory)[\"'=:\s]+(/[\w./-]+)")
+
+# Shared LLM - one httpx pool, retry config, and tokenizer table per process
+_LLM = None
+
+
+def _get_llm() -> ChatOpenAI:
+    """Build the shared ChatOpenAI on first use and reuse it after"""
+    global _LLM
+    if _LLM is None:
+        _LLM = ChatOpenAI(model="gpt-5-mini", max_retries=2, timeout=60)
+    return _LLM
+
 class SimpleOrchestrator:
     """
     Minimal orchestrator that:
@@ -21,104 +106,363 @@ class SimpleOrchestrator:
     2. Runs the 4 phase tools in sequence
     3. Returns the generated package
     """
-    
-    def __init__(self):
-        self.api_key = os.getenv("OPENAI_API_KEY")
+
+    __slots__ = (
+        "api_key", "max_steps", "server_path", "_execute_batcher",
+        "_client", "_agent", "_agent_lock", "_inflight", "_client_config"
+    )
+
+    def __init__(self, max_steps: int = 10):
+        self.api_key = _OPENAI_KEY
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
+
+        # Plan-size knob - changing it only rebuilds the agent, not the LLM
+        self.max_steps = max_steps
         
         # Path to our merged MCP server (now in package)
-        import mcpsquared.merged_mcp_server
-        self.server_path = mcpsquared.merged_mcp_server.__file__
-        logger.info("SimpleOrchestrator initialized")
-    
-    async def generate_workflows(self, mcp_config: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Main entry point - generates workflows for the given MCP
-        
-        Args:
-            mcp_config: Dict with name, command, args for target MCP
-            
-        Returns:
-            Result dict with package location
-        """
-        logger.info(f"Generating workflows for MCP: {mcp_config.get('name')}")
-        
-        # Create MCP client with our merged server
-        client_config = {
+        self.server_path = _SERVER_PATH
+
+        # Client config is env-dependent but the env is fixed per process -
+        # build the dict once instead of per generate_workflows call
+        self._client_config = {
             "mcpServers": {
                 "mcpsquared": {
                     "command": "python",
-                    "args": [self.server_path],
+                    # -u: unbuffered server writes, so whole response frames
+                    # reach the client reader in one chunk
+                    "args": ["-u", self.server_path],
                     "transport": "stdio",
                     "env": {
                         "OPENAI_API_KEY": self.api_key,
-                        "WORK_DIR": os.getenv("WORK_DIR"),
-                        "PHASE_SERVER_DEBUG_PATH": os.getenv("PHASE_SERVER_DEBUG_PATH"),
-                        "PHASE_SERVER_DEBUG_NICKNAME": os.getenv("PHASE_SERVER_DEBUG_NICKNAME")
+                        "WORK_DIR": _WORK_DIR,
+                        "PHASE_SERVER_DEBUG_PATH": _DEBUG_PATH,
+                        "PHASE_SERVER_DEBUG_NICKNAME": _DEBUG_NICK
                     }
                 }
             }
         }
-        
-        client = MCPClient.from_dict(client_config)
-        
-        # Create agent with simple prompt
-        agent = MCPAgent(
-            llm=ChatOpenAI(model="gpt-5-mini"),
-            client=client,
-            system_prompt=self._get_system_prompt(),
-            max_steps=10
-        )
-        
-        # Build the execution prompt
+
+        # Coalesce bursts of workflow executions into one flush per window
+        self._execute_batcher = AsyncBatcher(self._execute_workflow_batch)
+
+        # Lazily-built shared client/agent - the merged-server subprocess
+        # stays alive across generate_workflows calls
+        self._client = None
+        self._agent = None
+        self._agent_lock = asyncio.Lock()
+
+        # In-flight generation runs keyed by MCP signature - duplicate
+        # concurrent requests await the first run's future
+        self._inflight: Dict[str, asyncio.Future] = {}
+        logger.info("SimpleOrchestrator initialized")
+    
+    async def generate_workflows(self, mcp_config: Dict[str, Any], legacy: bool = False) -> Dict[str, Any]:
+        """
+        Main entry point - generates workflows for the given MCP
+
+        Args:
+            mcp_config: Dict with name, command, args for target MCP
+            legacy: Route through the agent-driven pipeline instead of
+                calling the phase functions directly
+
+        Returns:
+            Result dict with package location
+        """
+        logger.info(f"Generating workflows for MCP: {mcp_config.get('name')}")
+
+        # Same MCP signature + same server build means the same plan - skip
+        # the whole 4-phase pipeline on a verified cache hit
+        cache_key = self._plan_cache_key(mcp_config)
+        cached = self._load_cached_plan(cache_key)
+        if cached is not None:
+            logger.info("Plan cache hit for MCP: %s", mcp_config.get('name'))
+            return cached
+
+        # Coalesce duplicate concurrent requests onto the first run
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            logger.info("Joining in-flight generation for MCP: %s", mcp_config.get('name'))
+            return await inflight
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = fut
+        try:
+            if legacy:
+                parsed = await self._generate_workflows_with_agent(mcp_config)
+            else:
+                parsed = await self._run_phase_pipeline(mcp_config)
+            if parsed.get("status") == "success":
+                self._store_cached_plan(cache_key, parsed)
+            fut.set_result(parsed)
+            return parsed
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved in case no duplicate joined
+            raise
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    async def _run_phase_pipeline(self, mcp_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Call the phase functions directly - no LLM routing between phases"""
+        try:
+            # phase1_discover fuses the 1.1 connection test and 1.2 tool
+            # listing into one session, so both phase-1 steps are one await
+            discovery = await _merged.phase1_discover(
+                mcp_config['name'], mcp_config['command'], mcp_config['args']
+            )
+            if discovery.get("status") != "success":
+                return discovery
+
+            workflows = await _merged.phase2_1_create_workflow_configs(discovery["tools_file_path"])
+            if workflows.get("status") != "success":
+                return workflows
+
+            agents = await _merged.phase2_2_create_agent_configs(workflows["workflows_directory"])
+            if agents.get("status") != "success":
+                return agents
+
+            # Register the new package so the list/search tools answer with
+            # one SELECT instead of walking WORK_DIR. Indexing failures must
+            # never sink a successful generation.
+            try:
+                _index.index_project(
+                    mcp_config['name'], os.path.dirname(workflows["workflows_directory"])
+                )
+            except Exception as e:
+                logger.warning("Failed to index generated project: %s", e)
+
+            summary = (
+                f"project_complete: configs_directory {agents['configs_directory']} "
+                f"({workflows['workflows_created']} workflows)"
+            )
+            return self._parse_result(summary, mcp_config)
+
+        except Exception as e:
+            logger.error(f"Workflow generation failed: {e}")
+            error = {"status": "error", "error": str(e)}
+            if _INCLUDE_TB:
+                error["traceback"] = traceback.format_exc()
+            return error
+
+    async def _generate_workflows_with_agent(self, mcp_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Legacy path: let the agent route the 4 phase tools over stdio"""
         prompt = self._build_execution_prompt(mcp_config)
-        
+        cache_key = self._plan_cache_key(mcp_config)
+
+        # Phases that finished on a previous failed run are still on disk -
+        # tell the agent so it resumes instead of redoing them
+        checkpoints = self._load_phase_checkpoints(cache_key)
+        if checkpoints:
+            prompt += "\n\nAlready completed (skip these phases):\n" + "\n".join(
+                f"{marker}={path}" for marker, path in checkpoints.items()
+            )
+
         try:
-            # Run the agent
-            result = await agent.run(prompt)
-            
+            # Run the shared agent - the lock keeps concurrent callers from
+            # interleaving frames on the one stdio transport
+            async with self._agent_lock:
+                agent = self._get_agent()
+                result = await self._run_agent_streaming(agent, prompt, cache_key, checkpoints)
+
             logger.info(f"Agent completed: {result}")
-            
+
             # Parse result to get project directory
-            return self._parse_result(result, mcp_config)
-            
+            parsed = self._parse_result(result, mcp_config)
+            if parsed.get("status") == "success":
+                self._clear_phase_checkpoints(cache_key)
+                self._index_from_result(mcp_config, result)
+            return parsed
+
         except Exception as e:
             logger.error(f"Workflow generation failed: {e}")
-            import traceback
-            return {
-                "status": "error",
-                "error": str(e),
-                "traceback": traceback.format_exc()
-            }
-        finally:
-            await client.close_all_sessions()
-    
-    def _get_system_prompt(self) -> str:
-        """Simple system prompt for the agent"""
-        return """You are MCPSquared workflow generator. Execute the 4 phase tools in sequence:
+            error = {"status": "error", "error": str(e)}
+            if _INCLUDE_TB:
+                error["traceback"] = traceback.format_exc()
+            return error
 
-1. Call phase1_1_install_mcp_tool to test connection
-2. Call phase1_2_list_mcp_tools_tool to discover tools (save the tools_file_path)
-3. Call phase2_1_create_workflow_configs with the tools_file_path (save the workflows_directory)
-4. Call phase2_2_create_agent_configs with the workflows_directory
+    async def _run_agent_streaming(self, agent: MCPAgent, prompt: str, cache_key: str,
+                                   checkpoints: Dict[str, str]) -> str:
+        """
+        Consume the agent's output as it streams, checkpointing each phase.
 
-Return the final project directory path when complete."""
+        Per-phase markers are persisted the moment they appear, so a failure
+        in a later phase keeps the earlier phases' progress instead of
+        discarding the whole run with it.
+        """
+        if not hasattr(agent, "astream"):
+            return await agent.run(prompt)
+
+        chunks = []
+        async for chunk in agent.astream(prompt):
+            text = chunk if isinstance(chunk, str) else str(chunk)
+            chunks.append(text)
+            for marker, path in _PHASE_MARKER_RE.findall(text):
+                if checkpoints.get(marker) != path:
+                    checkpoints[marker] = path
+                    self._store_phase_checkpoints(cache_key, checkpoints)
+        return "".join(chunks)
+
+    def _index_from_result(self, mcp_config: Dict[str, Any], result_text: str) -> None:
+        """Register packages named in agent output with the workflow index.
+
+        The direct pipeline indexes from its own return values; this covers
+        legacy agent runs, whose only record of the project directory is the
+        path markers in the output text. Indexing failures must never sink
+        a successful generation.
+        """
+        project_dirs = {
+            os.path.dirname(path)
+            for marker, path in _PHASE_MARKER_RE.findall(result_text)
+            if marker in ("workflows_directory", "configs_directory")
+        }
+        for project_dir in project_dirs:
+            try:
+                _index.index_project(mcp_config['name'], project_dir)
+            except Exception as e:
+                logger.warning("Failed to index generated project %s: %s", project_dir, e)
+
+    def _phase_checkpoint_file(self, cache_key: str) -> str:
+        return os.path.join(_DEFAULT_WORK_DIR, _PLAN_CACHE_DIRNAME, f"{cache_key}.phases.json")
+
+    def _load_phase_checkpoints(self, cache_key: str) -> Dict[str, str]:
+        """Return checkpointed phase outputs whose paths still exist on disk"""
+        try:
+            record = fastjson.load_file(self._phase_checkpoint_file(cache_key))
+        except (OSError, ValueError):
+            return {}
+        return {marker: path for marker, path in record.items() if os.path.exists(path)}
+
+    def _store_phase_checkpoints(self, cache_key: str, checkpoints: Dict[str, str]) -> None:
+        checkpoint_file = self._phase_checkpoint_file(cache_key)
+        os.makedirs(os.path.dirname(checkpoint_file), exist_ok=True)
+        fastjson.dump_file(checkpoints, checkpoint_file)
+
+    def _clear_phase_checkpoints(self, cache_key: str) -> None:
+        """Drop resume state once the full run has been cached"""
+        try:
+            os.remove(self._phase_checkpoint_file(cache_key))
+        except OSError:
+            pass
+
+    def _get_agent(self) -> MCPAgent:
+        """Build the shared client/agent on first use and reuse it after"""
+        if self._agent is None:
+            self._client = MCPClient.from_dict(self._client_config)
+            self._agent = MCPAgent(
+                llm=_get_llm(),
+                client=self._client,
+                system_prompt=self._get_system_prompt(),
+                max_steps=self.max_steps
+            )
+        return self._agent
+
+    def _plan_cache_key(self, mcp_config: Dict[str, Any]) -> str:
+        """Digest of the MCP signature plus the merged server's mtime"""
+        try:
+            server_mtime = os.path.getmtime(self.server_path)
+        except OSError:
+            server_mtime = 0.0
+        payload = (
+            f"{mcp_config.get('name')}|{mcp_config.get('command')}|"
+            f"{fastjson.dumps(mcp_config.get('args', []))}|{server_mtime}"
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _plan_cache_file(self, cache_key: str) -> str:
+        return os.path.join(_DEFAULT_WORK_DIR, _PLAN_CACHE_DIRNAME, f"{cache_key}.json")
+
+    def _load_cached_plan(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result if its project paths are still on disk"""
+        try:
+            record = fastjson.load_file(self._plan_cache_file(cache_key))
+        except (OSError, ValueError):
+            return None
+        for path in record.pop("cached_paths", []):
+            if not os.path.isdir(path):
+                return None
+        return record
+
+    def _store_cached_plan(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Persist a successful plan result keyed by MCP signature"""
+        if result.get("status") != "success":
+            return
+        cache_file = self._plan_cache_file(cache_key)
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        record = dict(result)
+        # Remember which referenced directories existed so hits can be verified
+        record["cached_paths"] = [
+            p for p in _PATH_TOKEN_RE.findall(result.get("result", "")) if os.path.isdir(p)
+        ]
+        fastjson.dump_file(record, cache_file)
+
+    async def aclose(self) -> None:
+        """Close the shared client sessions - call at shutdown, not per request"""
+        global _LLM
+        if self._client is not None:
+            await self._client.close_all_sessions()
+            self._client = None
+            self._agent = None
+        if _LLM is not None:
+            try:
+                # root_async_client is the AsyncOpenAI client that owns the
+                # httpx pool; async_client is just its completions resource
+                await _LLM.root_async_client.close()
+            except Exception as e:
+                logger.debug("LLM client close failed: %s", e)
+            _LLM = None
+
+    async def generate_workflows_for_many(self, mcp_configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generate workflows for several MCPs concurrently.
+
+        MCP stdio handshakes are pure I/O, so overlapping the per-MCP runs
+        drops total wall time from the sum of latencies to the max.
+
+        Args:
+            mcp_configs: List of dicts with name, command, args for each MCP
+
+        Returns:
+            Result dicts in the same order as mcp_configs
+        """
+        logger.info(f"Generating workflows for {len(mcp_configs)} MCPs concurrently")
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self.generate_workflows(config)) for config in mcp_configs]
+
+        return [task.result() for task in tasks]
+
+    def _get_system_prompt(self) -> str:
+        """Simple system prompt for the agent"""
+        return _SYSTEM_PROMPT
     
     def _build_execution_prompt(self, mcp_config: Dict[str, Any]) -> str:
-        """Build the execution prompt with MCP details"""
-        return f"""Generate workflows for this MCP:
-        
-Name: {mcp_config['name']}
-Command: {mcp_config['command']}
-Args: {json.dumps(mcp_config['args'])}
-
-Execute all 4 phases and return the project directory."""
+        """Build the execution prompt - static prefix first, MCP details last"""
+        return (
+            _EXECUTION_PROMPT_PREFIX
+            + f"Name: {mcp_config['name']}\n"
+            + f"Command: {mcp_config['command']}\n"
+            + f"Args: {fastjson.dumps(mcp_config['args'])}"
+        )
     
     def _parse_result(self, result: str, mcp_config: Dict[str, Any]) -> Dict[str, Any]:
         """Parse agent result"""
+        # Fast path: structured agent output parses straight to a status
+        if result.lstrip()[:1] == "{":
+            try:
+                data = fastjson.loads(result)
+            except ValueError:
+                data = None
+            if isinstance(data, dict) and data.get("status") == "success":
+                return {
+                    "status": "success",
+                    "result": result,
+                    "mcp_name": mcp_config.get("name"),
+                    "message": "Workflow package generated successfully"
+                }
+
         # Look for success indicators
-        if "project_complete" in result or "configs_directory" in result:
+        if _SUCCESS_RE.search(result):
             return {
                 "status": "success",
                 "result": result,
@@ -133,59 +477,90 @@ Execute all 4 phases and return the project directory."""
                 "message": "Generation may be incomplete"
             }
     
-    # ============= API STUB METHODS =============
-    # These match the original MCPSquaredOrchestrator API but are not implemented yet
-    
+    # ============= REGISTRY QUERY METHODS =============
+    # Backed by the SQLite workflow index - populated after each generation
+
     def get_flows(self, domain: str = None) -> str:
         """List available generated workflows, optionally filtered by domain"""
-        return '{"error": "get_flows not implemented in alpha version"}'
-    
+        workflows = _index.search_workflows(domain=domain)
+        return fastjson.dumps({
+            "status": "success",
+            "domain": domain,
+            "workflow_count": len(workflows),
+            "workflows": workflows
+        })
+
     def get_flow_domains(self) -> str:
         """List all available workflow domains/categories"""
-        return '{"error": "get_flow_domains not implemented in alpha version"}'
-    
-    def sub_chat(self, message: str, history_id: str) -> str:
-        """Chat interface for workflow planning and assistance"""
-        return '{"error": "sub_chat not implemented in alpha version"}'
-    
-    def package_workflow_mcp(self, workflows: list, base_mcp: str) -> str:
-        """Package specific workflows into installable MCP"""
-        return '{"error": "package_workflow_mcp not implemented in alpha version"}'
-    
+        domains = _index.list_domains()
+        return fastjson.dumps({"status": "success", "domains": domains})
+
     def get_processed_mcps_list(self) -> str:
         """Get list of all MCPs that have been processed by MCPSquared"""
-        return '{"error": "get_processed_mcps_list not implemented in alpha version"}'
-    
+        mcps = _index.list_mcps()
+        return fastjson.dumps({"status": "success", "mcp_count": len(mcps), "mcps": mcps})
+
     def search_my_workflows(self, mcp_name: str = None, domain: str = None, workflow_name_pattern: str = None) -> str:
         """Search workflows across all processed MCPs with filtering options"""
-        return '{"error": "search_my_workflows not implemented in alpha version"}'
+        workflows = _index.search_workflows(
+            mcp_name=mcp_name, domain=domain, name_pattern=workflow_name_pattern
+        )
+        return fastjson.dumps({
+            "status": "success",
+            "filters": {
+                "mcp_name": mcp_name,
+                "domain": domain,
+                "workflow_name_pattern": workflow_name_pattern
+            },
+            "workflow_count": len(workflows),
+            "workflows": workflows
+        })
+
+    # ============= API STUB METHODS =============
+    # These match the original MCPSquaredOrchestrator API but are not implemented yet
+
+    def sub_chat(self, message: str, history_id: str) -> str:
+        """Chat interface for workflow planning and assistance"""
+        return _ERR_SUB_CHAT
+
+    def package_workflow_mcp(self, workflows: list, base_mcp: str) -> str:
+        """Package specific workflows into installable MCP"""
+        return _ERR_PACKAGE_WORKFLOW_MCP
     
     async def execute_any_workflow(self, workflow_name: str, workflow_args: Dict[str, Any], package_name: str = None) -> str:
-        """Execute any workflow from the registry by name"""
+        """Execute any workflow from the registry by name (burst-batched)"""
+        return await self._execute_batcher.submit((workflow_name, workflow_args, package_name))
+
+    async def _execute_workflow_batch(self, requests: list) -> list:
+        """Flush handler: run a burst of workflow executions in one gather"""
+        return await asyncio.gather(*(
+            self._execute_one_workflow(name, args, package) for name, args, package in requests
+        ))
+
+    async def _execute_one_workflow(self, workflow_name: str, workflow_args: Dict[str, Any], package_name: str = None) -> str:
+        """Execute a single workflow from the registry by name"""
         logger.info(f"Executing workflow: {workflow_name} from project: {package_name}")
         
         try:
-            # Import _base workflow_runner directly (no merged server needed for execution)
-            import sys
-            from pathlib import Path
-            sys.path.insert(0, '/tmp/mcpsquared-base')
-            from mcpsquared_base.utils.workflow_runner import run_workflow
-            from mcpsquared_base.models.schemas import InputArgs, InputArg
-            from mcpsquared_base.utils.debug import mcp_debug_log
-            
+            # _base workflow_runner is imported at module scope (no merged
+            # server needed for execution)
             mcp_debug_log(f"execute_any_workflow: {workflow_name} from {package_name}")
             
-            # Convert workflow_args to InputArgs format
-            input_args = InputArgs(args=[
-                InputArg(name=key, value=value) 
+            # Convert workflow_args to InputArgs format. model_construct
+            # skips the per-model validator chain - workflow_args arrives
+            # pre-validated from the tool layer, so there is nothing for
+            # pydantic to check N times here.
+            input_args = InputArgs.model_construct(args=[
+                InputArg.model_construct(name=key, value=value)
                 for key, value in workflow_args.items()
             ])
-            
-            mcp_debug_log(f"Input args: {input_args.model_dump()}")
+
+            if logger.isEnabledFor(logging.DEBUG):
+                mcp_debug_log(f"Input args: {input_args.model_dump()}")
             
             # Use _base workflow_runner directly
             # For now, assume project directory from WORK_DIR - should be smarter in future
-            project_directory = package_name or os.getenv("WORK_DIR", "/tmp/mcpsquared")
+            project_directory = package_name or _DEFAULT_WORK_DIR
             
             mcp_debug_log(f"Calling run_workflow with config_dir={project_directory}")
             result = await run_workflow(
@@ -194,7 +569,7 @@ Execute all 4 phases and return the project directory."""
                 config_dir=project_directory  # Points to dir containing workflows/ and agents/
             )
             
-            return json.dumps({
+            return fastjson.dumps({
                 "status": "success",
                 "workflow_name": workflow_name,
                 "result": result
@@ -202,17 +577,14 @@ Execute all 4 phases and return the project directory."""
             
         except Exception as e:
             logger.error(f"Workflow execution failed: {e}")
-            import traceback
-            return json.dumps({
-                "status": "error", 
-                "error": str(e), 
-                "traceback": traceback.format_exc(),
-                "workflow_name": workflow_name
-            })
+            error = {"status": "error", "error": str(e), "workflow_name": workflow_name}
+            if _INCLUDE_TB:
+                error["traceback"] = traceback.format_exc()
+            return fastjson.dumps(error)
     
     async def domain_specific_agent(self, prompt: str) -> str:
         """Execute domain-specific agent for advanced workflow generation"""
-        return '{"error": "domain_specific_agent not implemented in alpha version"}'
+        return _ERR_DOMAIN_SPECIFIC_AGENT
 
 async def main():
     """Test the orchestrator"""
@@ -225,8 +597,18 @@ async def main():
         "args": ["/home/GOD/carton_mcp/server_fastmcp.py"]
     }
     
-    result = await orchestrator.generate_workflows(test_config)
-    print(json.dumps(result, indent=2))
+    try:
+        result = await orchestrator.generate_workflows(test_config)
+        print(fastjson.dumps_pretty(result))
+    finally:
+        await orchestrator.aclose()
 
 if __name__ == "__main__":
+    # uvloop swaps in a libuv event loop - fewer syscalls per poll for the
+    # subprocess-stdio and HTTPS traffic this loop spends its life on
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
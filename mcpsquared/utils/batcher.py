@@ -0,0 +1,77 @@
+"""
+Async call batcher for coalescing bursts of lookups
+
+LLM clients tend to fire many workflow calls in rapid succession. Queueing
+them behind futures and flushing the queue in one pass amortizes the per-call
+setup cost across the whole burst.
+"""
+
+import asyncio
+import logging
+from typing import Any, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBatcher:
+    """
+    Simple async debouncer: a request arriving while the batcher is idle is
+    flushed immediately, so solo calls pay no timer latency. Requests that
+    land while a flush is already in flight queue up and go out together -
+    when the queue reaches max_batch_size or after max_wait_ms, whichever
+    comes first. The flush handler receives the whole batch of requests and
+    must return one result per request, in order.
+    """
+
+    def __init__(self, flush_handler, max_batch_size: int = 10, max_wait_ms: float = 50.0):
+        self._flush_handler = flush_handler
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000.0
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._flush_task = None
+        self._flushing = False
+
+    async def submit(self, request: Any) -> Any:
+        """Queue one request and wait for its result from the next flush"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            await self._flush()
+        elif not self._flushing:
+            # Idle batcher: dispatch now rather than holding the request
+            # hostage to the debounce window
+            await self._flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._delayed_flush())
+
+        return await future
+
+    async def _delayed_flush(self) -> None:
+        """Timer path: flush whatever accumulated during the wait window"""
+        await asyncio.sleep(self._max_wait)
+        await self._flush()
+
+    async def _flush(self) -> None:
+        """Resolve every pending future from a single handler pass"""
+        task, self._flush_task = self._flush_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        logger.debug(f"Flushing batch of {len(batch)} requests")
+        self._flushing = True
+        try:
+            results = await self._flush_handler([request for request, _ in batch])
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self._flushing = False
@@ -0,0 +1,54 @@
+"""
+Small TTL cache for repeated identical lookups
+
+MCP tool listings and derived artifacts are effectively static for a given
+MCP version, so short-lived caching makes repeat introspection nearly free.
+"""
+
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Minimal time-bounded cache keyed by hashable signatures"""
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing/expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key with this cache's TTL"""
+        if len(self._entries) >= self.maxsize:
+            self._evict()
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def _evict(self) -> None:
+        """Drop expired entries, then oldest-expiring entries if still full"""
+        now = time.monotonic()
+        for key in [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
+
+        while len(self._entries) >= self.maxsize:
+            oldest = min(self._entries, key=lambda k: self._entries[k][0])
+            del self._entries[oldest]
+
+    def pop(self, key: Hashable) -> None:
+        """Drop one entry if present"""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._entries.clear()
@@ -0,0 +1,82 @@
+"""
+orjson-backed JSON helpers for MCPSquared servers
+
+orjson serializes several times faster than stdlib json and returns bytes,
+so file persistence can skip the str -> bytes round-trip entirely. All tool
+response bodies and config/tool/workflow file writes should go through these
+helpers instead of calling json.dumps/json.load directly.
+"""
+
+import orjson
+
+# Pretty output is only for files humans will open - wire responses stay compact
+_FILE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
+
+def dumps(obj) -> str:
+    """Serialize obj to a compact JSON string for tool responses"""
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+def dumps_pretty(obj) -> str:
+    """Serialize obj to an indented JSON string"""
+    return orjson.dumps(obj, option=_FILE_OPTIONS).decode()
+
+
+def dump_bytes(obj) -> bytes:
+    """Serialize obj to indented JSON bytes for file payloads"""
+    return orjson.dumps(obj, option=_FILE_OPTIONS)
+
+
+def loads(data):
+    """Deserialize JSON from a str or bytes payload"""
+    return orjson.loads(data)
+
+
+def dump_file(obj, path) -> None:
+    """Write obj to path as indented JSON, writing bytes directly"""
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(obj, option=_FILE_OPTIONS))
+
+
+def dump_model_file(model, path) -> None:
+    """
+    Write a pydantic v2 model to path as indented JSON.
+
+    Goes through pydantic-core's Rust serializer (model_dump_json) instead
+    of materializing an intermediate dict and re-walking it in Python.
+    """
+    with open(path, 'wb') as f:
+        f.write(model.model_dump_json(indent=2).encode())
+
+
+def load_file(path):
+    """Load JSON from path via a single bytes read"""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def dump_file_streaming(obj, path, stream_key: str) -> None:
+    """
+    Write obj to path, streaming the obj[stream_key] list item by item.
+
+    For large payloads (e.g. schemas for MCPs with hundreds of tools) this
+    never materializes the full document in memory - each list item is
+    serialized and written independently.
+    """
+    with open(path, 'wb') as f:
+        f.write(b'{')
+        for key, value in obj.items():
+            if key == stream_key:
+                continue
+            f.write(orjson.dumps(key))
+            f.write(b': ')
+            f.write(orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
+            f.write(b', ')
+        f.write(orjson.dumps(stream_key))
+        f.write(b': [')
+        for index, item in enumerate(obj[stream_key]):
+            if index:
+                f.write(b', ')
+            f.write(orjson.dumps(item, option=orjson.OPT_SERIALIZE_NUMPY))
+        f.write(b']}')
@@ -19,16 +19,21 @@ setup(
         "mcpsquared.phase_tools.models",
         "mcpsquared.phase_tools.utils",
         "mcpsquared.schema_tools",
-        "mcpsquared.schema_tools.models"
+        "mcpsquared.schema_tools.models",
+        "mcpsquared.utils"
     ],
     install_requires=[
         "fastmcp>=2.0.0",
         "pydantic>=2.0.0",
         "mcp-use>=0.1.0",
         "langchain-openai>=0.1.0",
-        "python-dotenv>=1.0.0"
+        "python-dotenv>=1.0.0",
+        "orjson>=3.10",
+        "aiofiles>=23.0",
+        "uvloop>=0.19; sys_platform != 'win32'",
+        "mcpsquared-base>=0.1.0"
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.11",
     entry_points={
         "console_scripts": [
             "mcpsquared-server=mcpsquared.server:main",
@@ -39,9 +44,6 @@ setup(
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
 )
\ No newline at end of file